@@ -1,58 +1,150 @@
-from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, NamedTuple
 
 from fastapi import HTTPException
-from app.schema.claim_schema import ClaimSchema
+from app.schema.claim_schema import ClaimSchema, ClaimValidationResultSchema
 
 
-KEY_FIELDS = [
+class Rule(NamedTuple):
+    """A check of one claim field; `hard` violations reject the claim"""
+
+    field: str
+    check: Callable  # called with the field value (and the claim), True if valid
+    message: str
+    hard: bool = False
+
+
+# Text fields Pydantic requires but still accepts blank
+KEY_TEXT_FIELDS = [
     "claim_id",
     "type",
-    "date",
-    "amount",
     "description",
     "customer_id",
     "policy_number",
     "incident_location",
-    "timestamp_submitted",
 ]
+MIN_DESCRIPTION_LENGTH = 30
+
+
+def _not_blank(value, claim) -> bool:
+    return bool(value.strip())
+
+
+def _is_reported(value, claim) -> bool:
+    return value is not None and value != ""
+
+
+# --- Rules of every claim type ---
+COMMON_RULES = [
+    *(
+        Rule(field, _not_blank, f"{field} is required", hard=True)
+        for field in KEY_TEXT_FIELDS
+    ),
+    Rule(
+        "description",
+        lambda value, claim: len(value) >= MIN_DESCRIPTION_LENGTH,
+        f"description must be at least {MIN_DESCRIPTION_LENGTH} characters long",
+        hard=True,
+    ),
+    Rule("amount", lambda value, claim: value > 0, "amount must be positive"),
+    Rule(
+        "date",
+        lambda value, claim: value <= claim.timestamp_submitted.date(),
+        "date is after the submission date",
+    ),
+]
+
+# --- Extra rules, keyed by a word of the claim type (e.g. auto_theft) ---
+TYPE_RULES = {
+    "theft": [
+        Rule(
+            "police_report", _is_reported, "police_report is required for theft claims"
+        ),
+    ],
+    "collision": [
+        Rule(
+            "other_party_involved",
+            _is_reported,
+            "other_party_involved must be reported for collision claims",
+        ),
+        Rule(
+            "police_report",
+            lambda value, claim: not claim.injuries_reported
+            or _is_reported(value, claim),
+            "police_report is required for collisions with injuries",
+        ),
+    ],
+    "liability": [
+        Rule(
+            "injuries_reported",
+            _is_reported,
+            "injuries_reported must be reported for liability claims",
+        ),
+    ],
+    "medical": [
+        Rule(
+            "injuries_reported",
+            lambda value, claim: value is True,
+            "medical claims must report injuries",
+        ),
+    ],
+}
 
 
-def parse_claim_key_fields(raw_data: ClaimSchema) -> ClaimSchema:
+@lru_cache(maxsize=256)
+def compile_rules(claim_type: str) -> tuple:
     """
-    Extract key claim information and validate:
-    - completeness for key fields
-    - description length > 30 characters
-    Returns a dict with extracted fields if valid.
+    Rule set of a claim type, built once per type: the common rules plus the
+    rules of every word of the type, each with a precompiled field getter.
     """
-    raw_data_values = raw_data.model_dump()
-    # Check for missing key fields
-    missing_fields = [
-        field
-        for field in KEY_FIELDS
-        if field not in raw_data_values or raw_data_values[field] in (None, "")
+    words = set(claim_type.lower().replace("-", "_").split("_"))
+    rules = COMMON_RULES + [
+        rule
+        for word, type_rules in TYPE_RULES.items()
+        if word in words
+        for rule in type_rules
     ]
-    if missing_fields:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Missing mandatory fields: {', '.join(missing_fields)}",
-        )
+    return tuple((attrgetter(rule.field), rule) for rule in rules)
 
-    # Extract key information
-    key_info = {field: raw_data_values[field] for field in KEY_FIELDS}
 
-    # Convert 'date' to datetime.date if it is a string
-    if isinstance(key_info["date"], str):
-        try:
-            key_info["date"] = datetime.strptime(key_info["date"], "%Y-%m-%d").date()
-        except Exception as e:
-            raise HTTPException(
-                status_code=400, detail=f"Invalid date format for field 'date': {e}"
-            )
+def check_claim(claim: ClaimSchema) -> tuple[list[str], list[str]]:
+    """
+    Run every rule of the claim's type in one pass.
+    Returns (errors, warnings): errors reject the claim, warnings are stored
+    with its assessment as validation errors.
+    """
+    errors, warnings = [], []
+    for get_value, rule in compile_rules(claim.type):
+        if not rule.check(get_value(claim), claim):
+            (errors if rule.hard else warnings).append(rule.message)
+    return errors, warnings
+
 
-    # Check description length
-    if len(key_info["description"]) < 30:
+def validate_claim(claim: ClaimSchema) -> list[str]:
+    """
+    Validate a claim at intake. Raises 400 listing every hard error,
+    otherwise returns the soft violations to store with the assessment.
+    """
+    errors, warnings = check_claim(claim)
+    if errors:
         raise HTTPException(
-            status_code=400, detail="Description must be at least 30 characters long"
+            status_code=400, detail=f"Invalid claim: {'; '.join(errors)}"
         )
+    return warnings
+
 
-    return raw_data
+def validate_claims(claims: Iterable[ClaimSchema]) -> list[ClaimValidationResultSchema]:
+    """Validate a batch of claims without raising, one result per claim."""
+    results = []
+    for claim in claims:
+        errors, warnings = check_claim(claim)
+        results.append(
+            ClaimValidationResultSchema(
+                claim_id=claim.claim_id,
+                valid=not errors,
+                errors=errors,
+                warnings=warnings,
+            )
+        )
+    return results
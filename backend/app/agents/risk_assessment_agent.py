@@ -1,21 +1,13 @@
 # --- Function to assess claim risk ---
+from typing import Optional
+
 from app.schema.claim_schema import ClaimSchema
+from app.schema.llm_schema import AgentConfigSchema
 from app.schema.risk_schema import RiskAssessmentLLMSchema
-from langchain_core.prompts import ChatPromptTemplate
-
-
-from app.service.llm_service import llm
-
-
-llm_with_structured_output = llm.with_structured_output(RiskAssessmentLLMSchema)
-
-
-def assess_claim_risk(claim_data: ClaimSchema) -> RiskAssessmentLLMSchema:
-    """
-    Analyze a claim for fraud indicators using LLM and return a structured RiskAssessmentSchema.
-    """
+from app.service.llm_service import get_prompt_template, invoke_structured
 
-    prompt = f"""
+# --- Prompt Template ---
+RISK_ASSESSMENT_PROMPT_TEMPLATE = """
         You are a fraud detection assistant for insurance claims.
 
         Analyze a claim for fraud indicators using LLM and return a structured RiskAssessmentSchema.
@@ -34,10 +26,17 @@ def assess_claim_risk(claim_data: ClaimSchema) -> RiskAssessmentLLMSchema:
 
         """
 
-    format_prompt = ChatPromptTemplate.from_template(prompt)
-    formatted_prompt = format_prompt.format_messages(
+
+async def assess_claim_risk(
+    claim_data: ClaimSchema, config: Optional[AgentConfigSchema] = None
+) -> RiskAssessmentLLMSchema:
+    """
+    Analyze a claim for fraud indicators using LLM and return a structured RiskAssessmentSchema.
+    `config` overrides the model and prompt (used for replay and shadow runs).
+    """
+    template = (config and config.risk_prompt) or RISK_ASSESSMENT_PROMPT_TEMPLATE
+    formatted_prompt = get_prompt_template(template).format_messages(
         claim_data=claim_data.model_dump_json()
     )
 
-    response = llm_with_structured_output.invoke(formatted_prompt)
-    return response
+    return await invoke_structured(RiskAssessmentLLMSchema, formatted_prompt, config)
@@ -1,25 +1,15 @@
-from langchain_core.prompts import ChatPromptTemplate
+from typing import Optional
+
 from app.schema.claim_schema import ClaimSchema
+from app.schema.llm_schema import AgentConfigSchema
 from app.schema.risk_schema import RiskAssessmentLLMSchema
-from app.service.llm_service import llm
+from app.service.llm_service import get_prompt_template, invoke_structured
 
 
 from app.schema.routing_decision_schema import RoutingDecisionLLMSchema
 
-
-llm_with_structured_output = llm.with_structured_output(RoutingDecisionLLMSchema)
-
-
-# --- Call Method ---
-def decide_routing(
-    claim_data: ClaimSchema, risk_assessment: RiskAssessmentLLMSchema
-) -> RoutingDecisionLLMSchema:
-    """
-    Decide the routing for a claim based on claim data and risk assessment.
-    """
-
-    # --- Prompt Template ---
-    ROUTING_PROMPT_TEMPLATE = f"""
+# --- Prompt Template ---
+ROUTING_PROMPT_TEMPLATE = """
     You are an experienced operations manager at an insurance company.
 
     Your task is to determine the optimal processing path for a claim based on:
@@ -41,14 +31,24 @@ def decide_routing(
     Output your decision in JSON following the schema.
     """
 
-    prompt = ChatPromptTemplate.from_template(ROUTING_PROMPT_TEMPLATE)
-    formatted_prompt = prompt.format_messages(
+
+# --- Call Method ---
+async def decide_routing(
+    claim_data: ClaimSchema,
+    risk_assessment: RiskAssessmentLLMSchema,
+    config: Optional[AgentConfigSchema] = None,
+) -> RoutingDecisionLLMSchema:
+    """
+    Decide the routing for a claim based on claim data and risk assessment.
+    `config` overrides the model and prompt (used for replay and shadow runs).
+    """
+    template = (config and config.routing_prompt) or ROUTING_PROMPT_TEMPLATE
+    formatted_prompt = get_prompt_template(template).format_messages(
         claim_data=claim_data.model_dump_json(),
         risk_assessment=risk_assessment.model_dump_json(),
     )
 
-    response = llm_with_structured_output.invoke(formatted_prompt)
-    return response
+    return await invoke_structured(RoutingDecisionLLMSchema, formatted_prompt, config)
 
 
 # sample input
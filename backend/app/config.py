@@ -0,0 +1,9 @@
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load environment variables from the .env file once per process."""
+    load_dotenv()
@@ -1,10 +1,13 @@
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from dotenv import load_dotenv
 import os
 
+from app.config import load_env
+
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
 # Async SQLite URL
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./fnol.db")
@@ -29,7 +32,99 @@ async def get_db():
         yield session
 
 
+def add_missing_columns(sync_conn) -> None:
+    """
+    Add nullable columns and indexes introduced after a table was created.
+    `create_all` only creates missing tables, so existing databases would
+    otherwise never get new columns or indexes. Idempotent.
+    """
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.execute(
+                text(
+                    f'ALTER TABLE "{table.name}" '
+                    f'ADD COLUMN "{column.name}" {column_type}'
+                )
+            )
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+def upgrade_autoincrement(sync_conn) -> None:
+    """
+    Rebuild SQLite tables declared with `sqlite_autoincrement` that were
+    created without it (the option only applies to new tables), so deleted
+    ids are never handed out again. The id sequence is also kept above the
+    ids of the table's `info["archive_table"]`, whose rows keep their id.
+    Idempotent; run after `add_missing_columns`.
+    """
+    if sync_conn.dialect.name != "sqlite":
+        return
+    for table in Base.metadata.sorted_tables:
+        if not table.dialect_options["sqlite"]["autoincrement"]:
+            continue
+        table_sql = sync_conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": table.name},
+        ).scalar()
+        if table_sql is None:
+            continue
+
+        if "AUTOINCREMENT" not in table_sql.upper():
+            # create / copy / drop / rename, then recreate the dropped indexes
+            copy_metadata = MetaData()
+            for other in Base.metadata.sorted_tables:
+                other.to_metadata(copy_metadata)
+            rebuilt = table.to_metadata(copy_metadata, name=f"{table.name}_rebuild")
+            columns = ", ".join(f'"{column.name}"' for column in table.columns)
+            sync_conn.execute(CreateTable(rebuilt))
+            sync_conn.execute(
+                text(
+                    f'INSERT INTO "{rebuilt.name}" ({columns}) '
+                    f'SELECT {columns} FROM "{table.name}"'
+                )
+            )
+            sync_conn.execute(text(f'DROP TABLE "{table.name}"'))
+            sync_conn.execute(
+                text(f'ALTER TABLE "{rebuilt.name}" RENAME TO "{table.name}"')
+            )
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+
+        archive_table = table.info.get("archive_table")
+        if archive_table is None:
+            continue
+        floor = sync_conn.execute(
+            text(f'SELECT max(id) FROM "{archive_table}"')
+        ).scalar()
+        if not floor:
+            continue
+        seq = sync_conn.execute(
+            text("SELECT seq FROM sqlite_sequence WHERE name = :name"),
+            {"name": table.name},
+        ).scalar()
+        if seq is None:
+            sync_conn.execute(
+                text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+                {"name": table.name, "seq": floor},
+            )
+        elif seq < floor:
+            sync_conn.execute(
+                text("UPDATE sqlite_sequence SET seq = :seq WHERE name = :name"),
+                {"name": table.name, "seq": floor},
+            )
+
+
 # create tables
 async def create_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(add_missing_columns)
+        await conn.run_sync(upgrade_autoincrement)
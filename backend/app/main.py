@@ -1,18 +1,67 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
-from app.db.database import Base, engine
+from app.db.database import (
+    AsyncSessionLocal,
+    Base,
+    add_missing_columns,
+    engine,
+    upgrade_autoincrement,
+)
+from app.route.admin_route import router as admin_router
 from app.route.claim_route import router as claim_router
+from app.route.work_queue_route import router as work_queue_router
+from app.service.admission_service import AdmissionControlMiddleware
+from app.service.archive_service import ARCHIVE_INTERVAL_SECONDS, run_archive_worker
+from app.service.dashboard_broadcaster import dashboard_broadcaster
+from app.service.llm_service import LLM_WARMUP, warm_up_llm
+from app.service.profiling_service import ProfilingMiddleware
+from app.service.timeline_service import run_timeline_writer
+from app.service.work_queue_service import backfill_priority_ranks
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-        yield
+        await conn.run_sync(add_missing_columns)
+        await conn.run_sync(upgrade_autoincrement)
+
+    # Rank work items queued before priority ranks were stored
+    async with AsyncSessionLocal() as db:
+        await backfill_priority_ranks(db)
+
+    # Optionally build the LLM clients before serving the first claim
+    if LLM_WARMUP:
+        await asyncio.to_thread(warm_up_llm)
+
+    # Background archival of aged claims into the archive tables
+    archive_task = None
+    if ARCHIVE_INTERVAL_SECONDS > 0:
+        archive_task = asyncio.create_task(run_archive_worker())
+
+    # Background writer of the per-claim processing timelines
+    timeline_task = asyncio.create_task(run_timeline_writer())
+
+    # Live dashboard streams end as soon as the server is asked to exit
+    dashboard_broadcaster.start()
+
+    yield
+
+    # End streams still open (servers other than uvicorn)
+    dashboard_broadcaster.close()
+    if archive_task:
+        archive_task.cancel()
+    # Flushes the remaining timeline events before exiting
+    timeline_task.cancel()
+    await asyncio.gather(timeline_task, return_exceptions=True)
 
 
 app = FastAPI(title="Claim Processing API", lifespan=lifespan)
+app.add_middleware(ProfilingMiddleware)
+# Added last so it runs first: shed requests are rejected before anything else
+app.add_middleware(AdmissionControlMiddleware)
 
 
 @app.get("/")
@@ -20,4 +69,12 @@ async def read_root():
     return {"Hello": "World"}
 
 
+@app.get("/health")
+async def health():
+    """Liveness check, exempt from admission control"""
+    return {"status": "ok"}
+
+
 app.include_router(claim_router)
+app.include_router(work_queue_router)
+app.include_router(admin_router)
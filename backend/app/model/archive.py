@@ -0,0 +1,31 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+
+from app.db.database import Base
+from app.model.claim_assessment import ClaimAssessmentColumns
+from app.model.claims import ClaimColumns
+
+
+class ArchivedClaim(ClaimColumns, Base):
+    """Aged claim moved out of the hot `claims` table (keeps its original id)"""
+
+    __tablename__ = "claims_archive"
+
+    archived_at = Column(DateTime, nullable=False)
+
+    # --- Relationships ---
+    assessment = relationship(
+        "ArchivedClaimAssessment", back_populates="claim", uselist=False
+    )
+
+
+class ArchivedClaimAssessment(ClaimAssessmentColumns, Base):
+    """Assessment archived together with its claim"""
+
+    __tablename__ = "claim_assessments_archive"
+
+    # --- Relationships ---
+    claim_id = Column(
+        Integer, ForeignKey("claims_archive.id"), unique=True, nullable=False
+    )
+    claim = relationship("ArchivedClaim", back_populates="assessment", lazy="joined")
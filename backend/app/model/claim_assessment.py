@@ -6,17 +6,11 @@ from app.schema.risk_schema import RiskCategory
 from app.schema.routing_decision_schema import Priority
 
 
-class ClaimAssessment(Base):
-    __tablename__ = "claim_assessments"
+class ClaimAssessmentColumns:
+    """Columns shared by the hot `claim_assessments` table and its archive"""
 
     id = Column(Integer(), primary_key=True)
 
-    # --- Relationships ---
-    claim_id = Column(Integer, ForeignKey("claims.id"), unique=True, nullable=False)
-    claim = relationship(
-        "Claim", back_populates="assessment", lazy="joined"
-    )  # eager load using JOIN
-
     # --- Risk fields ---
     risk_score = Column(Integer, nullable=False)
     risk_category = Column(Enum(RiskCategory), nullable=False)
@@ -26,3 +20,21 @@ class ClaimAssessment(Base):
     # --- Routing fields ---
     priority = Column(Enum(Priority), nullable=False)
     adjuster_tier = Column(String, nullable=False)
+
+    # --- Intake fields ---
+    # "; " joined soft rule violations, see app.agents.intake_agent
+    validation_errors = Column(String, nullable=True)
+
+
+class ClaimAssessment(ClaimAssessmentColumns, Base):
+    __tablename__ = "claim_assessments"
+    __table_args__ = {
+        "sqlite_autoincrement": True,
+        "info": {"archive_table": "claim_assessments_archive"},
+    }
+
+    # --- Relationships ---
+    claim_id = Column(Integer, ForeignKey("claims.id"), unique=True, nullable=False)
+    claim = relationship(
+        "Claim", back_populates="assessment", lazy="joined"
+    )  # eager load using JOIN
@@ -0,0 +1,26 @@
+from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String
+
+from app.db.database import Base
+
+
+class ClaimTimelineEvent(Base):
+    """One processing stage of a claim; rows are only ever appended"""
+
+    __tablename__ = "claim_timeline_events"
+
+    id = Column(Integer, primary_key=True)
+    # business claim id, so the timeline outlives archival of the claim
+    claim_id = Column(String, nullable=False, index=True)
+    stage = Column(String, nullable=False)
+    started_at = Column(DateTime, nullable=False)
+    duration_ms = Column(Float, nullable=False)
+    # exception type when the stage failed, None when it completed
+    error = Column(String, nullable=True)
+
+    # --- LLM stages only ---
+    model = Column(String, nullable=True)
+    input_tokens = Column(Integer, nullable=True)
+    output_tokens = Column(Integer, nullable=True)
+    cached_tokens = Column(Integer, nullable=True)
+    retries = Column(Integer, nullable=True)
+    hedged = Column(Boolean, nullable=True)
@@ -5,8 +5,8 @@ from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 
-class Claim(Base):
-    __tablename__ = "claims"
+class ClaimColumns:
+    """Columns shared by the hot `claims` table and its archive"""
 
     id = Column(Integer, primary_key=True)
 
@@ -19,6 +19,8 @@ class Claim(Base):
     customer_id = Column(String, nullable=False)
     policy_number = Column(String, nullable=False)
     incident_location = Column(String, nullable=False)
+    # canonical form of incident_location, see normalize_location
+    location_key = Column(String, nullable=True, index=True)
     timestamp_submitted = Column(DateTime, nullable=False)
 
     # --- Optional Fields ---
@@ -28,6 +30,16 @@ class Claim(Base):
     customer_tenure_days = Column(Integer, nullable=True)
     previous_claims_count = Column(Integer, nullable=True)
 
+
+class Claim(ClaimColumns, Base):
+    __tablename__ = "claims"
+    # never reuse ids of archived rows, archive tables keep the original id
+    # (existing databases are upgraded by upgrade_autoincrement)
+    __table_args__ = {
+        "sqlite_autoincrement": True,
+        "info": {"archive_table": "claims_archive"},
+    }
+
     # --- Relationships ---
     # claim_risks = relationship("ClaimRisk", back_populates="claim")
     # claim_routes = relationship("ClaimRoute", back_populates="claim")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from app.db.database import Base
+
+
+class FraudIndicator(Base):
+    """Dictionary of canonical fraud indicators"""
+
+    __tablename__ = "fraud_indicators"
+
+    id = Column(Integer, primary_key=True)
+    key = Column(String, unique=True, nullable=False)  # canonical form
+    label = Column(String, nullable=False)  # first phrasing seen
+    created_at = Column(DateTime, nullable=False)
+
+
+class ClaimFraudIndicator(Base):
+    """Link between a claim and the fraud indicators its assessment flagged"""
+
+    __tablename__ = "claim_fraud_indicators"
+    __table_args__ = (
+        # "top indicators since X" is answered from this index alone
+        Index("ix_claim_fraud_indicators_flagged_at", "flagged_at", "indicator_id"),
+        # "claims flagged for X" (optionally in a time window)
+        Index(
+            "ix_claim_fraud_indicators_indicator_flagged", "indicator_id", "flagged_at"
+        ),
+    )
+
+    claim_id = Column(Integer, ForeignKey("claims.id"), primary_key=True)
+    indicator_id = Column(Integer, ForeignKey("fraud_indicators.id"), primary_key=True)
+    # submission time of the claim, used for time windows
+    flagged_at = Column(DateTime, nullable=False)
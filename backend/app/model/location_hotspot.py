@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Date, Index, Integer, String
+
+from app.db.database import Base
+
+
+class LocationHotspot(Base):
+    """Daily count of high risk claims per normalized incident location"""
+
+    __tablename__ = "location_hotspots"
+    __table_args__ = (
+        # "top locations since X" only reads the days of the window
+        Index("ix_location_hotspots_day", "day", "location_key"),
+    )
+
+    location_key = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)  # submission date of the claims
+    high_risk_count = Column(Integer, nullable=False, default=0)
+    label = Column(String, nullable=False)  # one of the raw locations, for display
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String
+
+from app.db.database import Base
+from app.schema.routing_decision_schema import AdjusterTier, Priority
+from app.schema.work_queue_schema import WorkItemStatus
+
+
+class Adjuster(Base):
+    __tablename__ = "adjusters"
+
+    id = Column(String, primary_key=True)
+    tier = Column(Enum(AdjusterTier), nullable=False)
+    capacity = Column(Integer, nullable=False)
+
+
+class WorkItem(Base):
+    """Persisted state of a claim in the adjuster work queue"""
+
+    __tablename__ = "work_items"
+    # the per-tier priority queues: head of a queue is one index seek
+    __table_args__ = (
+        Index("ix_work_items_queue", "tier", "status", "priority_rank", "enqueued_at"),
+        # adjuster load, counted on every claim of a work item
+        Index("ix_work_items_adjuster_status", "adjuster_id", "status"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    claim_id = Column(String, unique=True, nullable=False)
+    tier = Column(Enum(AdjusterTier), nullable=False)
+    priority = Column(Enum(Priority), nullable=False)
+    # served in rank order, see PRIORITY_RANK (nullable for existing databases)
+    priority_rank = Column(Integer, nullable=True)
+    status = Column(Enum(WorkItemStatus), nullable=False, index=True)
+    adjuster_id = Column(String, ForeignKey("adjusters.id"), nullable=True)
+
+    enqueued_at = Column(DateTime, nullable=False)
+    assigned_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
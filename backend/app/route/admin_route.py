@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+
+from app.schema.profile_schema import ProfileReportListSchema
+from app.service.admission_service import get_admission_metrics
+from app.service.archive_service import (
+    ARCHIVE_AFTER_DAYS,
+    ARCHIVE_BATCH_SIZE,
+    archive_aged_claims,
+)
+from app.service.fraud_indicator_service import backfill_fraud_indicators
+from app.service.llm_service import get_llm_metrics
+from app.service.location_service import backfill_locations
+from app.service.profiling_service import (
+    get_profile_report_path,
+    list_profile_reports,
+    render_profile_report,
+)
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/profiles", response_model=ProfileReportListSchema)
+async def list_profiles():
+    """List stored request profiles, newest first"""
+    return {"data": list_profile_reports()}
+
+
+@router.get("/profiles/{report_id}")
+async def download_profile(report_id: str):
+    """Download a stored profile as a pstats file (snakeviz, pstats, ...)"""
+    path = get_profile_report_path(report_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile report not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
+
+
+@router.get("/profiles/{report_id}/text", response_class=PlainTextResponse)
+async def view_profile(report_id: str, limit: int = 50):
+    """Render a stored profile as text sorted by cumulative time"""
+    report = render_profile_report(report_id, limit)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Profile report not found")
+    return report
+
+
+@router.post("/archive/run")
+async def run_archive(
+    older_than_days: int = Query(ARCHIVE_AFTER_DAYS, ge=0),
+    batch_size: int = Query(ARCHIVE_BATCH_SIZE, ge=1),
+    max_batches: int | None = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db),
+):
+    """Move aged claims and their assessments into the archive tables"""
+    archived = await archive_aged_claims(db, older_than_days, batch_size, max_batches)
+    return {"archived_claims": archived}
+
+
+@router.get("/llm/metrics")
+async def llm_metrics():
+    """Counters of the LLM layer"""
+    return get_llm_metrics()
+
+
+@router.get("/admission")
+async def admission_metrics():
+    """In-flight requests, queue depth and shed counts per admission pool"""
+    return get_admission_metrics()
+
+
+@router.post("/fraud-indicators/backfill")
+async def backfill_indicators(
+    batch_size: int = Query(500, ge=1), db: AsyncSession = Depends(get_db)
+):
+    """Normalize the fraud indicators of assessments stored before the link table"""
+    return {"backfilled_assessments": await backfill_fraud_indicators(db, batch_size)}
+
+
+@router.post("/locations/backfill")
+async def backfill_location_keys(
+    batch_size: int = Query(500, ge=1), db: AsyncSession = Depends(get_db)
+):
+    """Normalize locations of claims stored before location keys and rebuild hotspots"""
+    return {"backfilled_claims": await backfill_locations(db, batch_size)}
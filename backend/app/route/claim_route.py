@@ -1,29 +1,74 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.agents.intake_agent import validate_claims
 from app.db.database import get_db
-from app.schema.claim_assessment_schema import ClaimAssessmentListSchema
-from app.schema.claim_schema import ClaimSchema
+from app.route.json_response import FastJSONResponse
+from app.schema.claim_assessment_schema import (
+    ClaimAssessmentDetailedSchema,
+    ClaimAssessmentListSchema,
+    ClaimProcessResponseSchema,
+)
+from app.schema.claim_schema import ClaimSchema, ClaimValidationResultSchema
 from app.schema.dashboard_schema import DashboardDataSchema
+from app.schema.fraud_indicator_schema import (
+    FraudIndicatorClaimsSchema,
+    FraudIndicatorTrendSchema,
+)
+from app.schema.export_schema import EXPORT_MEDIA_TYPES, ExportFormat
+from app.schema.risk_schema import RiskCategory
+from app.schema.timeline_schema import ClaimTimelineSchema
+from app.schema.routing_decision_schema import Priority
 from app.service.claim_service import (
     claim_processing_sse,
+    dashboard_stream,
     get_claim_assessment_by_claim_id,
     process_claim,
     list_claim_assessments_paginated,
     get_dashboard_data,
 )
+from app.service.fraud_indicator_service import (
+    get_claims_for_fraud_indicator,
+    get_top_fraud_indicators,
+)
+from app.service.export_service import (
+    ensure_export_format_available,
+    parse_export_cursor,
+    stream_claims_export,
+)
+from app.service.timeline_service import get_claim_timeline
 
-router = APIRouter(prefix="/claims", tags=["Claims"])
+# Endpoints return FastJSONResponse instances directly so FastAPI skips the
+# response_model re-validation and jsonable_encoder pass
+router = APIRouter(
+    prefix="/claims", tags=["Claims"], default_response_class=FastJSONResponse
+)
 
 
-@router.post("/process")
+@router.post("/process", response_model=ClaimProcessResponseSchema)
 async def process_claim_route(
     claim_data: ClaimSchema, db: AsyncSession = Depends(get_db)
 ):
     """Endpoint to process a new claim"""
-    await process_claim(db, claim_data)
-    return {"message": "Claim processed successfully", "claim": claim_data}
+    risk_assessment, routing_decision = await process_claim(db, claim_data)
+    return FastJSONResponse(
+        ClaimProcessResponseSchema(
+            message="Claim processed successfully",
+            claim_id=claim_data.claim_id,
+            risk_assessment=risk_assessment,
+            routing_decision=routing_decision,
+        )
+    )
+
+
+@router.post("/validate", response_model=list[ClaimValidationResultSchema])
+async def validate_claims_route(claims: list[ClaimSchema]):
+    """Validate a batch of claims against the rules of their type, without processing"""
+    return FastJSONResponse(validate_claims(claims))
 
 
 @router.post("/process-claim-live")
@@ -51,16 +96,99 @@ async def list_claim_assessments(
     page_no: int = 1, page_size: int = 10, db: AsyncSession = Depends(get_db)
 ):
     """List claim assessments with pagination"""
-    return await list_claim_assessments_paginated(db, page_no, page_size)
+    return FastJSONResponse(
+        await list_claim_assessments_paginated(db, page_no, page_size)
+    )
 
 
 @router.get("/dashboard", response_model=DashboardDataSchema)
 async def get_dashboard(db: AsyncSession = Depends(get_db)):
     """Get comprehensive dashboard data with metrics and analytics"""
-    return await get_dashboard_data(db)
+    return FastJSONResponse(await get_dashboard_data(db))
 
 
-@router.get("/processed/{claim_id}")
+@router.get("/dashboard/stream")
+async def stream_dashboard():
+    """
+    Live dashboard over SSE: a `snapshot` event with the full dashboard data,
+    then a `delta` event with counter increments for every processed claim.
+    """
+    return StreamingResponse(
+        dashboard_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/processed/{claim_id}", response_model=ClaimAssessmentDetailedSchema)
 async def get_claim_assessment(claim_id: str, db: AsyncSession = Depends(get_db)):
     """Get claim assessment by claim ID"""
-    return await get_claim_assessment_by_claim_id(db, claim_id)
+    return FastJSONResponse(await get_claim_assessment_by_claim_id(db, claim_id))
+
+
+@router.get("/processed/{claim_id}/timeline", response_model=ClaimTimelineSchema)
+async def get_claim_timeline_route(claim_id: str, db: AsyncSession = Depends(get_db)):
+    """Get the processing timeline (stage timings, LLM usage) of a claim"""
+    return FastJSONResponse(await get_claim_timeline(db, claim_id))
+
+
+@router.get("/export")
+async def export_claims(
+    format: ExportFormat = ExportFormat.NDJSON,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    claim_type: Optional[str] = None,
+    risk_category: Optional[RiskCategory] = None,
+    priority: Optional[Priority] = None,
+    cursor: Optional[str] = Query(
+        None,
+        description="Resume after this row (the `cursor` of the last row received)",
+    ),
+    limit: Optional[int] = Query(None, ge=1),
+):
+    """
+    Stream claims with their assessments as NDJSON, CSV or Parquet.
+    Every row carries a `cursor`; pass the last one back to resume an export.
+    """
+    ensure_export_format_available(format)
+    parse_export_cursor(cursor)  # reject a bad cursor before streaming starts
+
+    return StreamingResponse(
+        stream_claims_export(
+            format,
+            start_date=start_date,
+            end_date=end_date,
+            claim_type=claim_type,
+            risk_category=risk_category,
+            priority=priority,
+            cursor=cursor,
+            limit=limit,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f"attachment; filename=claims-export.{format.value}"
+        },
+    )
+
+
+@router.get("/analytics/fraud-indicators", response_model=FraudIndicatorTrendSchema)
+async def top_fraud_indicators(
+    window_days: int = Query(30, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """Top fraud indicators of the last `window_days` vs. the previous window"""
+    return FastJSONResponse(await get_top_fraud_indicators(db, window_days, limit))
+
+
+@router.get(
+    "/analytics/fraud-indicators/{indicator}/claims",
+    response_model=FraudIndicatorClaimsSchema,
+)
+async def claims_for_fraud_indicator(
+    indicator: str,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """Claims flagged for a fraud indicator (canonical key or any phrasing)"""
+    return FastJSONResponse(await get_claims_for_fraud_indicator(db, indicator, limit))
@@ -0,0 +1,27 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # orjson natively handles str enums, dates and datetimes; only nested
+    # Pydantic models inside plain containers reach this hook
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that skips FastAPI's generic `jsonable_encoder` walk.
+    Pydantic models are rendered by their compiled serializer, everything else
+    by orjson. Return it directly from an endpoint so the response_model
+    validation pass is skipped as well (the response_model still documents it).
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+from app.schema.work_queue_schema import (
+    AdjusterSchema,
+    WorkItemSchema,
+    WorkQueueMetricsSchema,
+)
+from app.service.work_queue_service import (
+    claim_next_work_item,
+    complete_work_item,
+    get_work_queue_metrics,
+    register_adjuster,
+)
+
+router = APIRouter(prefix="/work-queue", tags=["Work Queue"])
+
+
+@router.post("/adjusters", response_model=AdjusterSchema)
+async def upsert_adjuster(
+    adjuster_data: AdjusterSchema, db: AsyncSession = Depends(get_db)
+):
+    """Register an adjuster (or update its tier / capacity)"""
+    return await register_adjuster(db, adjuster_data)
+
+
+@router.post("/adjusters/{adjuster_id}/claim", response_model=WorkItemSchema)
+async def claim_work_item(adjuster_id: str, db: AsyncSession = Depends(get_db)):
+    """Assign the next claim of the adjuster's tier (most urgent, then oldest)"""
+    return await claim_next_work_item(db, adjuster_id)
+
+
+@router.post("/items/{claim_id}/complete", response_model=WorkItemSchema)
+async def complete_claim(claim_id: str, db: AsyncSession = Depends(get_db)):
+    """Mark an assigned claim as completed"""
+    return await complete_work_item(db, claim_id)
+
+
+@router.get("/metrics", response_model=WorkQueueMetricsSchema)
+async def work_queue_metrics(db: AsyncSession = Depends(get_db)):
+    """Queue depth, wait times and adjuster load per tier"""
+    return await get_work_queue_metrics(db)
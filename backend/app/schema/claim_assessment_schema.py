@@ -48,3 +48,16 @@ class ClaimAssessmentDetailedSchema(BaseModel):
     routing_decision: RoutingDecisionLLMSchema = Field(
         ..., description="Routing decision details"
     )
+
+
+class ClaimProcessResponseSchema(BaseModel):
+    """Response of the claim processing endpoint"""
+
+    message: str = Field(..., description="Processing status message")
+    claim_id: str = Field(..., description="Unique identifier for the claim")
+    risk_assessment: RiskAssessmentLLMSchema = Field(
+        ..., description="Risk assessment details"
+    )
+    routing_decision: RoutingDecisionLLMSchema = Field(
+        ..., description="Routing decision details"
+    )
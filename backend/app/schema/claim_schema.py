@@ -51,3 +51,17 @@ class ClaimSchema(BaseModel):
     previous_claims_count: Optional[int] = Field(
         None, description="Number of previous claims"
     )
+
+
+class ClaimValidationResultSchema(BaseModel):
+    """Result of validating one claim against the rules of its type"""
+
+    claim_id: str = Field(..., description="Unique ID of the claim")
+    valid: bool = Field(..., description="Whether the claim can be processed")
+    errors: list[str] = Field(
+        default_factory=list, description="Violations rejecting the claim"
+    )
+    warnings: list[str] = Field(
+        default_factory=list,
+        description="Violations stored with the assessment as validation errors",
+    )
@@ -1,6 +1,6 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
-from datetime import date
+from datetime import date, datetime
 
 
 class RiskDistribution(BaseModel):
@@ -75,6 +75,9 @@ class RecentActivity(BaseModel):
     risk_level: str = Field(..., description="Risk assessment level")
     priority: str = Field(..., description="Processing priority")
     submitted_date: date = Field(..., description="Date submitted")
+    submitted_at: Optional[datetime] = Field(
+        None, description="Submission timestamp, recent_activity is ordered by it"
+    )
 
 
 class DashboardDataSchema(BaseModel):
@@ -112,3 +115,22 @@ class DashboardDataSchema(BaseModel):
     high_risk_locations: List[str] = Field(
         default_factory=list, max_items=5, description="Locations with high risk claims"
     )
+
+
+class DashboardDeltaSchema(BaseModel):
+    """Incremental dashboard update for one newly processed claim"""
+
+    sequence: int = Field(
+        ..., description="Assessment id of the claim, increasing in commit order"
+    )
+    increments: Dict[str, int] = Field(
+        ...,
+        description="Counter increments by field path, e.g. risk_distribution.high",
+    )
+    amount: float = Field(..., description="Claim amount, for the amount metrics")
+    risk_score: int = Field(..., description="Risk score, for the average risk score")
+    recent_activity: RecentActivity = Field(
+        ...,
+        description="Item to insert into recent_activity by submitted_at "
+        "(newest first), keeping the 10 newest",
+    )
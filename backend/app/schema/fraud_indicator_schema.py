@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class FraudIndicatorCountSchema(BaseModel):
+    """Number of claims flagged for an indicator in a time window"""
+
+    key: str = Field(..., description="Canonical indicator key")
+    label: str = Field(..., description="Human readable indicator")
+    count: int = Field(0, description="Claims flagged in the window")
+    previous_count: int = Field(0, description="Claims flagged in the previous window")
+
+
+class FraudIndicatorTrendSchema(BaseModel):
+    """Top fraud indicators of a time window"""
+
+    window_days: int
+    since: datetime
+    data: List[FraudIndicatorCountSchema]
+
+
+class FraudIndicatorClaimsSchema(BaseModel):
+    """Claims flagged for a fraud indicator"""
+
+    key: str
+    label: str
+    claim_ids: List[str]
@@ -0,0 +1,36 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AgentConfigSchema(BaseModel):
+    """LLM configuration of the risk and routing agents (e.g. a candidate to replay)"""
+
+    model_config = ConfigDict(frozen=True, protected_namespaces=())
+
+    model: Optional[str] = Field(None, description="Model name, default LLM_MODEL")
+    temperature: Optional[float] = Field(None, description="Sampling temperature")
+    risk_prompt: Optional[str] = Field(
+        None, description="Risk assessment prompt template with {claim_data}"
+    )
+    routing_prompt: Optional[str] = Field(
+        None,
+        description="Routing prompt template with {claim_data} and {risk_assessment}",
+    )
+
+
+class LLMCallSchema(BaseModel):
+    """Metrics of a single structured LLM call"""
+
+    model_config = ConfigDict(protected_namespaces=())
+
+    schema_name: str = Field(..., description="Structured output schema")
+    model: str = Field(..., description="Model name")
+    latency_ms: float = Field(..., description="Call latency")
+    input_tokens: Optional[int] = Field(None, description="Prompt tokens")
+    output_tokens: Optional[int] = Field(None, description="Completion tokens")
+    cached_tokens: Optional[int] = Field(
+        None, description="Prompt tokens served from the context cache"
+    )
+    attempt: int = Field(1, description="1 for the first call, >1 for re-prompts")
+    repaired: bool = Field(False, description="Output was repaired locally")
+    hedged: bool = Field(False, description="A hedge request was fired")
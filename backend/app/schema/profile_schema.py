@@ -0,0 +1,28 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class ProfileReportSchema(BaseModel):
+    """Metadata of a stored request profile"""
+
+    report_id: str = Field(..., description="Identifier of the profile report")
+    method: str = Field(..., description="HTTP method of the profiled request")
+    path: str = Field(..., description="Path of the profiled request")
+    status_code: Optional[int] = Field(None, description="Response status code")
+    started_at: str = Field(..., description="Request start time (ISO 8601)")
+    wall_ms: float = Field(..., description="Wall-clock time of the request")
+    cpu_ms: float = Field(..., description="CPU time of the request")
+    await_ms: float = Field(..., description="Time spent awaiting I/O")
+    concurrent_requests: int = Field(
+        0, description="Requests overlapping the profile (their CPU time is included)"
+    )
+    llm_calls: int = Field(0, description="Structured LLM calls made by the request")
+    categories_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Non-overlapping time in validation, hydration, prompt "
+        "building and the LLM client (CPU), and waiting for the LLM",
+    )
+
+
+class ProfileReportListSchema(BaseModel):
+    data: List[ProfileReportSchema]
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ReplaySummarySchema(BaseModel):
+    """Aggregated diff of a candidate replay against stored assessments"""
+
+    replayed: int = Field(0, description="Claims replayed")
+    errors: int = Field(0, description="Claims where the candidate failed")
+    risk_category_flips: int = Field(0, description="Claims with a different category")
+    priority_changes: int = Field(0, description="Claims with a different priority")
+    adjuster_tier_changes: int = Field(
+        0, description="Claims routed to a different adjuster tier"
+    )
+    mean_risk_score_delta: float = Field(0.0, description="Mean candidate - stored")
+    mean_abs_risk_score_delta: float = Field(0.0, description="Mean |delta|")
+    mean_latency_ms: float = Field(0.0, description="Mean candidate latency per claim")
+    mean_latency_ms_delta: Optional[float] = Field(
+        None, description="Mean candidate - production latency (shadow mode only)"
+    )
+    total_input_tokens: int = Field(0, description="Prompt tokens used")
+    total_output_tokens: int = Field(0, description="Completion tokens used")
+    mean_tokens_delta: Optional[float] = Field(
+        None, description="Mean candidate - production tokens (shadow mode only)"
+    )
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TimelineStageSchema(BaseModel):
+    """Timing of one processing stage of a claim"""
+
+    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+
+    stage: str = Field(..., description="Stage name, e.g. risk_llm")
+    started_at: datetime = Field(..., description="Stage start time")
+    duration_ms: float = Field(..., description="Stage duration")
+    error: Optional[str] = Field(
+        None, description="Exception type when the stage failed"
+    )
+    model: Optional[str] = Field(None, description="LLM model of the stage")
+    input_tokens: Optional[int] = Field(None, description="Prompt tokens")
+    output_tokens: Optional[int] = Field(None, description="Completion tokens")
+    cached_tokens: Optional[int] = Field(
+        None, description="Prompt tokens served from the context cache"
+    )
+    retries: Optional[int] = Field(None, description="LLM re-prompts")
+    hedged: Optional[bool] = Field(None, description="A hedge request was fired")
+
+
+class ClaimTimelineSchema(BaseModel):
+    """Processing timeline of a claim"""
+
+    claim_id: str = Field(..., description="Unique ID of the claim")
+    total_ms: float = Field(..., description="Sum of the stage durations")
+    stages: List[TimelineStageSchema] = Field(..., description="Stages in order")
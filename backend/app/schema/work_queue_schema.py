@@ -0,0 +1,63 @@
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from app.schema.routing_decision_schema import AdjusterTier, Priority
+
+
+class WorkItemStatus(str, Enum):
+    """Lifecycle of a claim in the adjuster work queue"""
+
+    QUEUED = "queued"
+    ASSIGNED = "assigned"
+    COMPLETED = "completed"
+
+
+class AdjusterSchema(BaseModel):
+    """Adjuster pulling work from the queue of its tier"""
+
+    adjuster_id: str = Field(..., description="Unique ID of the adjuster")
+    tier: AdjusterTier = Field(..., description="Tier whose queue the adjuster serves")
+    capacity: int = Field(5, ge=1, description="Maximum claims worked at once")
+
+
+class WorkItemSchema(BaseModel):
+    """Claim waiting in or taken from the work queue"""
+
+    claim_id: str
+    tier: AdjusterTier
+    priority: Priority
+    status: WorkItemStatus
+    adjuster_id: Optional[str] = None
+    enqueued_at: datetime
+    assigned_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+
+class TierQueueMetrics(BaseModel):
+    """Queue depth and wait times of one adjuster tier"""
+
+    depth: int = Field(0, description="Claims waiting")
+    in_progress: int = Field(0, description="Claims assigned and not completed")
+    oldest_wait_seconds: float = Field(
+        0.0, description="Age of the oldest waiting claim"
+    )
+    avg_wait_seconds: float = Field(
+        0.0, description="Mean queue wait of recently assigned claims"
+    )
+    p90_wait_seconds: float = Field(
+        0.0, description="90th percentile queue wait of recently assigned claims"
+    )
+
+
+class AdjusterLoadSchema(BaseModel):
+    adjuster_id: str
+    tier: AdjusterTier
+    capacity: int
+    active: int
+
+
+class WorkQueueMetricsSchema(BaseModel):
+    tiers: Dict[str, TierQueueMetrics]
+    adjusters: List[AdjusterLoadSchema]
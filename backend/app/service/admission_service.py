@@ -0,0 +1,177 @@
+import asyncio
+import os
+from collections import deque
+
+from app.config import load_env
+
+# Load environment variables from .env file
+load_env()
+
+
+# --- Admission control configuration ---
+# In-flight requests and wait queue length of the claim processing endpoints
+ADMISSION_PROCESS_LIMIT = int(os.getenv("ADMISSION_PROCESS_LIMIT", "8"))
+ADMISSION_PROCESS_QUEUE = int(os.getenv("ADMISSION_PROCESS_QUEUE", "16"))
+# Same for every other endpoint (dashboard, lookups, exports, ...)
+ADMISSION_READ_LIMIT = int(os.getenv("ADMISSION_READ_LIMIT", "64"))
+ADMISSION_READ_QUEUE = int(os.getenv("ADMISSION_READ_QUEUE", "128"))
+# Longest a queued request waits for a slot before it is shed
+ADMISSION_QUEUE_TIMEOUT_SECONDS = float(
+    os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "2")
+)
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "5"))
+
+# Heavy endpoints: hold a DB session and LLM calls for seconds. Matched
+# exactly: /claims/processed/{claim_id} lookups are reads
+PROCESS_PATHS = {"/claims/process", "/claims/process-claim-live"}
+# Never queued or shed: health checks, long-lived streams and these metrics
+EXEMPT_PATHS = ("/", "/health", "/claims/dashboard/stream", "/admin/admission")
+
+
+class AdmissionPool:
+    """
+    Bounded in-flight limit with a short FIFO wait queue.
+    A request over the limit waits for a slot for at most `timeout` seconds;
+    when the queue is full or the wait times out it is shed, so a burst costs
+    a fast 503 instead of piling up sessions and LLM calls.
+    """
+
+    def __init__(self, limit: int, queue_size: int, timeout: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_timeout = 0
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting in the queue if needed. False if shed."""
+        if self.in_flight < self.limit and not self.waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        if len(self.waiters) >= self.queue_size:
+            self.shed_queue_full += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            # shield: on timeout the slot may have been handed over meanwhile
+            await asyncio.wait_for(asyncio.shield(waiter), self.timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            if waiter.done():
+                self.release()
+            else:
+                self._forget(waiter)
+            raise
+
+        if waiter.done():
+            self.admitted += 1
+            return True
+        self._forget(waiter)
+        self.shed_timeout += 1
+        return False
+
+    def _forget(self, waiter: asyncio.Future) -> None:
+        waiter.cancel()
+        try:
+            self.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self) -> None:
+        """Free a slot, handing it directly to the oldest waiter if any."""
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # in_flight is unchanged
+                return
+        self.in_flight -= 1
+
+    def metrics(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": len(self.waiters),
+            "queue_size": self.queue_size,
+            "admitted": self.admitted,
+            "shed_queue_full": self.shed_queue_full,
+            "shed_timeout": self.shed_timeout,
+        }
+
+
+# Processing and reads have separate pools: a processing surge fills its own
+# small pool and is shed, while dashboard and lookup reads keep being served
+admission_pools = {
+    "process": AdmissionPool(
+        ADMISSION_PROCESS_LIMIT,
+        ADMISSION_PROCESS_QUEUE,
+        ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ),
+    "read": AdmissionPool(
+        ADMISSION_READ_LIMIT,
+        ADMISSION_READ_QUEUE,
+        ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ),
+}
+
+
+def classify_request(path: str) -> str | None:
+    """Admission pool of a request path, None for exempt paths."""
+    if path in EXEMPT_PATHS:
+        return None
+    if path in PROCESS_PATHS:
+        return "process"
+    return "read"
+
+
+def get_admission_metrics() -> dict:
+    """In-flight, queue depth and shed counts of every admission pool (this worker)."""
+    return {name: pool.metrics() for name, pool in admission_pools.items()}
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware applying the admission pools. A slot is held until the
+    response is fully sent, so streamed responses count as in flight.
+    Shed requests get 503 with a Retry-After header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        pool_name = classify_request(scope["path"]) if scope["type"] == "http" else None
+        if pool_name is None:
+            await self.app(scope, receive, send)
+            return
+
+        pool = admission_pools[pool_name]
+        if not await pool.acquire():
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 503,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"retry-after", str(ADMISSION_RETRY_AFTER_SECONDS).encode()),
+                    ],
+                }
+            )
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": b'{"detail":"Server is busy, retry later"}',
+                }
+            )
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            pool.release()
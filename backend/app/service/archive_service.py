@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+from app.model.archive import ArchivedClaim, ArchivedClaimAssessment
+from app.model.claim_assessment import ClaimAssessment
+from app.model.claims import Claim
+
+# --- Archival configuration ---
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "365"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+# Interval of the background archival loop, 0 disables it
+ARCHIVE_INTERVAL_SECONDS = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", "0"))
+
+claims_table = Claim.__table__
+assessments_table = ClaimAssessment.__table__
+CLAIM_COLUMNS = [column.name for column in claims_table.columns]
+ASSESSMENT_COLUMNS = [column.name for column in assessments_table.columns]
+
+logger = logging.getLogger(__name__)
+
+
+async def archive_claims_batch(
+    db: AsyncSession, cutoff: datetime, batch_size: int = ARCHIVE_BATCH_SIZE
+) -> int:
+    """
+    Move one batch of claims submitted before `cutoff`, together with their
+    assessments, into the archive tables in a single transaction.
+    Returns the number of archived claims.
+    """
+    async with db.begin():
+        result = await db.execute(
+            select(claims_table.c.id)
+            .where(claims_table.c.timestamp_submitted < cutoff)
+            .order_by(claims_table.c.id)
+            .limit(batch_size)
+        )
+        claim_ids = result.scalars().all()
+        if not claim_ids:
+            return 0
+
+        await db.execute(
+            insert(ArchivedClaim.__table__).from_select(
+                CLAIM_COLUMNS + ["archived_at"],
+                select(
+                    *claims_table.columns, literal(datetime.now()).label("archived_at")
+                ).where(claims_table.c.id.in_(claim_ids)),
+            )
+        )
+        await db.execute(
+            insert(ArchivedClaimAssessment.__table__).from_select(
+                ASSESSMENT_COLUMNS,
+                select(*assessments_table.columns).where(
+                    assessments_table.c.claim_id.in_(claim_ids)
+                ),
+            )
+        )
+        await db.execute(
+            delete(assessments_table).where(assessments_table.c.claim_id.in_(claim_ids))
+        )
+        await db.execute(delete(claims_table).where(claims_table.c.id.in_(claim_ids)))
+
+    return len(claim_ids)
+
+
+async def archive_aged_claims(
+    db: AsyncSession,
+    older_than_days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    max_batches: int | None = None,
+) -> int:
+    """
+    Archive claims older than `older_than_days` in batches, each batch in its
+    own short transaction so writers on the hot tables are never blocked long.
+    Returns the total number of archived claims.
+    """
+    cutoff = datetime.now() - timedelta(days=older_than_days)
+    total, batches = 0, 0
+    while max_batches is None or batches < max_batches:
+        archived = await archive_claims_batch(db, cutoff, batch_size)
+        total += archived
+        batches += 1
+        if archived < batch_size:
+            break
+        await asyncio.sleep(0)  # let other requests use the database between batches
+    return total
+
+
+async def run_archive_worker(interval_seconds: int = ARCHIVE_INTERVAL_SECONDS):
+    """Background loop archiving aged claims every `interval_seconds`."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await archive_aged_claims(db)
+        except Exception:
+            logger.exception("Archival run failed, retrying next interval")
+        await asyncio.sleep(interval_seconds)
@@ -1,20 +1,38 @@
-from sqlalchemy import select, func, case, desc
+from sqlalchemy import bindparam, select, func, case, desc, text
 
 from fastapi import HTTPException
-from app.agents.intake_agent import parse_claim_key_fields
+from app.agents.intake_agent import validate_claim
 from app.agents.risk_assessment_agent import assess_claim_risk
 from app.agents.routing_agent import decide_routing
+from app.service.fraud_indicator_service import link_fraud_indicators
+from app.service.location_service import (
+    get_high_risk_locations,
+    normalize_location,
+    record_high_risk_location,
+)
+from app.service.dashboard_broadcaster import (
+    CLOSED,
+    RESYNC,
+    dashboard_broadcaster,
+)
+from app.service.llm_service import record_llm_calls
+from app.service.replay_service import maybe_schedule_shadow
+from app.service.timeline_service import ClaimTimeline, submit_timeline
+from app.service.work_queue_service import add_work_item
+from app.model.archive import ArchivedClaim, ArchivedClaimAssessment
 from app.model.claim_assessment import ClaimAssessment
 from app.model.claims import Claim
 from app.schema.claim_assessment_schema import (
+    ClaimAssessmentDetailedSchema,
     ClaimAssessmentListSchema,
     ClaimAssessmentSimpleSchema,
 )
 from app.schema.claim_schema import ClaimSchema
-from app.schema.risk_schema import RiskAssessmentLLMSchema
-from app.schema.routing_decision_schema import RoutingDecisionLLMSchema
+from app.schema.risk_schema import RiskAssessmentLLMSchema, RiskCategory
+from app.schema.routing_decision_schema import Priority, RoutingDecisionLLMSchema
 from app.schema.dashboard_schema import (
     DashboardDataSchema,
+    DashboardDeltaSchema,
     RiskDistribution,
     PriorityDistribution,
     AdjusterTierDistribution,
@@ -24,7 +42,7 @@ from app.schema.dashboard_schema import (
     ProcessingStats,
     RecentActivity,
 )
-from app.db.database import AsyncSession
+from app.db.database import AsyncSession, AsyncSessionLocal
 
 
 import json
@@ -34,6 +52,11 @@ from typing import Dict, List
 from collections import Counter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Precomputed enum -> JSON value maps, so rows are converted with a dict
+# lookup instead of per-row enum handling during serialization
+RISK_LEVEL_VALUES = {category: category.value for category in RiskCategory}
+PRIORITY_VALUES = {priority: priority.value for priority in Priority}
+
 
 async def claim_processing_sse(claim_data: ClaimSchema, db: AsyncSession):
     """Generator yielding live status updates for claim processing"""
@@ -42,19 +65,19 @@ async def claim_processing_sse(claim_data: ClaimSchema, db: AsyncSession):
         # Stage 1: Parsing
         yield f"data: {json.dumps({'stage': 'Parsing claim', 'status': 'in_progress'})}\n\n"
         await asyncio.sleep(1)
-        claim_data_parsed = parse_claim_key_fields(claim_data)
+        validate_claim(claim_data)
         yield f"data: {json.dumps({'stage': 'Parsing claim', 'status': 'done'})}\n\n"
 
         # Stage 2: Assessing Risk
         yield f"data: {json.dumps({'stage': 'Assessing risk', 'status': 'in_progress'})}\n\n"
         await asyncio.sleep(1)
-        risk_assessment = assess_claim_risk(claim_data_parsed)
+        risk_assessment = await assess_claim_risk(claim_data)
         yield f"data: {json.dumps({'stage': 'Assessing risk', 'status': 'done'})}\n\n"
 
         # Stage 3: Deciding Routing
         yield f"data: {json.dumps({'stage': 'Deciding routing', 'status': 'in_progress'})}\n\n"
         await asyncio.sleep(1)
-        routing_decision = decide_routing(claim_data_parsed, risk_assessment)
+        routing_decision = await decide_routing(claim_data, risk_assessment)
         yield f"data: {json.dumps({'stage': 'Deciding routing', 'status': 'done'})}\n\n"
 
         # Final message
@@ -66,30 +89,82 @@ async def claim_processing_sse(claim_data: ClaimSchema, db: AsyncSession):
         yield f"data: {json.dumps(error_message)}\n\n"
 
 
-async def process_claim(db: AsyncSession, raw_data: ClaimSchema) -> ClaimSchema:
+async def process_claim(
+    db: AsyncSession, claim_data: ClaimSchema
+) -> tuple[RiskAssessmentLLMSchema, RoutingDecisionLLMSchema]:
     """
     Async wrapper to process claim data in a single transaction.
+    Returns the risk assessment and routing decision of the claim.
     """
-    async with db.begin():
-        # Parse claim
-        claim_data = parse_claim_key_fields(raw_data)
-
-        # Save claim
-        saved_claim = await save_claim_to_db(db, claim_data, commit=False)
+    timeline = ClaimTimeline(claim_data.claim_id)
 
-        # Assess risk
-        risk_assessment = assess_claim_risk(claim_data)
-
-        # Decide routing
-        routing_decision = decide_routing(claim_data, risk_assessment)
+    try:
+        # Validate claim, rejecting it with every hard error at once
+        with timeline.stage("parse"):
+            validation_errors = validate_claim(claim_data)
+
+        async with db.begin():
+            # Save claim
+            with timeline.stage("claim_write"):
+                saved_claim = await save_claim_to_db(db, claim_data, commit=False)
+
+            # LLM calls of both agents, the baseline of shadow evaluations
+            with record_llm_calls() as llm_calls:
+                # Assess risk
+                with timeline.stage("risk_llm"):
+                    risk_assessment = await assess_claim_risk(claim_data)
+
+                # Decide routing
+                with timeline.stage("routing_llm"):
+                    routing_decision = await decide_routing(
+                        claim_data, risk_assessment
+                    )
+
+            with timeline.stage("assessment_write"):
+                # Save combined assessment (risk + routing)
+                assessment = await save_claim_assessment_to_db(
+                    db,
+                    saved_claim.id,
+                    risk_assessment,
+                    routing_decision,
+                    commit=False,
+                    flagged_at=saved_claim.timestamp_submitted,
+                    validation_errors=validation_errors,
+                )
+
+                # Count high risk claims in the location hotspots of the dashboard
+                if risk_assessment.risk_category == RiskCategory.HIGH:
+                    await record_high_risk_location(
+                        db,
+                        saved_claim.location_key,
+                        saved_claim.incident_location,
+                        saved_claim.timestamp_submitted.date(),
+                    )
+
+                # Queue the claim for an adjuster of the routed tier
+                add_work_item(
+                    db,
+                    claim_data.claim_id,
+                    routing_decision.adjuster_tier,
+                    routing_decision.priority,
+                )
+
+                # Commit here rather than on leaving the context, so it is timed
+                await db.commit()
+    finally:
+        # Persisted in the background by the timeline writer, including the
+        # stages of rejected and failed claims
+        submit_timeline(timeline)
+
+    # Push the new claim to live dashboard subscribers
+    publish_dashboard_delta(
+        claim_data, risk_assessment, routing_decision, assessment.id
+    )
 
-        # Save combined assessment (risk + routing)
-        await save_claim_assessment_to_db(
-            db, saved_claim.id, risk_assessment, routing_decision, commit=False
-        )
+    # Evaluate the shadow candidate in the background on sampled traffic
+    maybe_schedule_shadow(claim_data, risk_assessment, routing_decision, llm_calls)
 
-    # After exiting the context, transaction is committed automatically
-    return raw_data
+    return risk_assessment, routing_decision
 
 
 # Save claim
@@ -100,7 +175,10 @@ async def save_claim_to_db(
     Save the claim data to the database.
 
     """
-    new_claim = Claim(**claim_data.model_dump())
+    new_claim = Claim(
+        **claim_data.model_dump(),
+        location_key=normalize_location(claim_data.incident_location),
+    )
     db.add(new_claim)
 
     if commit:
@@ -119,10 +197,13 @@ async def save_claim_assessment_to_db(
     risk_data: RiskAssessmentLLMSchema,
     route_data: RoutingDecisionLLMSchema,
     commit: bool = True,
+    flagged_at: datetime | None = None,
+    validation_errors: list[str] | None = None,
 ) -> ClaimAssessment:
     """
     Save the claim assessment data to the database for a given claim.
-
+    Fraud indicators are also stored normalized, flagged at `flagged_at`
+    (the claim submission time, defaults to now).
     """
     fraud_indicators_str = ", ".join(risk_data.fraud_indicators)
 
@@ -134,9 +215,13 @@ async def save_claim_assessment_to_db(
         processing_score=risk_data.processing_score,
         priority=route_data.priority,
         adjuster_tier=route_data.adjuster_tier,
+        validation_errors="; ".join(validation_errors) if validation_errors else None,
     )
 
     db.add(new_claim_assessment)
+    await link_fraud_indicators(
+        db, claim_id, risk_data.fraud_indicators, flagged_at or datetime.now()
+    )
 
     if commit:
         await db.commit()
@@ -147,21 +232,73 @@ async def save_claim_assessment_to_db(
     return new_claim_assessment
 
 
+# --- Column projections of the read path ---
+# Only the columns a response needs are selected, into plain row tuples: no
+# ORM entities, identity map or joined eager load of the full claim row
+CLAIM_FIELDS = list(ClaimSchema.model_fields)
+ASSESSMENT_DETAIL_FIELDS = [
+    "fraud_indicators",
+    "risk_score",
+    "risk_category",
+    "processing_score",
+    "priority",
+    "adjuster_tier",
+]
+
+
+def _assessment_detail_query(claim_model, assessment_model):
+    # Core table columns: the statement skips the ORM result setup entirely
+    claims, assessments = claim_model.__table__.c, assessment_model.__table__.c
+    return (
+        select(
+            *(claims[name] for name in CLAIM_FIELDS),
+            *(assessments[name] for name in ASSESSMENT_DETAIL_FIELDS),
+        )
+        .join(assessment_model.__table__, assessments.claim_id == claims.id)
+        .where(claims.claim_id == bindparam("claim_id"))
+    )
+
+
+# Built once: only the bound claim_id changes between lookups
+ASSESSMENT_DETAIL_QUERY = _assessment_detail_query(Claim, ClaimAssessment)
+ARCHIVED_ASSESSMENT_DETAIL_QUERY = _assessment_detail_query(
+    ArchivedClaim, ArchivedClaimAssessment
+)
+
+
 async def get_claim_assessment_by_claim_id(
     db: AsyncSession, claim_id: str
-) -> ClaimAssessment | None:
+) -> ClaimAssessmentDetailedSchema:
     """
     Retrieve the claim assessment by claim ID.
+    Falls back to the archive tables when the claim is no longer hot.
     """
-    result = await db.execute(
-        select(ClaimAssessment)
-        .join(Claim, ClaimAssessment.claim_id == Claim.id)
-        .where(Claim.claim_id == claim_id)
-    )
-    claim_assessment = result.scalars().first()
-    if not claim_assessment:
+    params = {"claim_id": claim_id}
+    row = (await db.execute(ASSESSMENT_DETAIL_QUERY, params)).first()
+
+    if not row:
+        row = (await db.execute(ARCHIVED_ASSESSMENT_DETAIL_QUERY, params)).first()
+
+    if not row:
         raise HTTPException(status_code=404, detail="Claim assessment not found")
-    return claim_assessment
+
+    return ClaimAssessmentDetailedSchema(
+        claim=ClaimSchema.model_validate(
+            {name: getattr(row, name) for name in CLAIM_FIELDS}
+        ),
+        risk_assessment=RiskAssessmentLLMSchema(
+            fraud_indicators=(
+                row.fraud_indicators.split(", ") if row.fraud_indicators else []
+            ),
+            risk_score=row.risk_score,
+            risk_category=row.risk_category,
+            processing_score=row.processing_score,
+        ),
+        routing_decision=RoutingDecisionLLMSchema(
+            priority=row.priority,
+            adjuster_tier=row.adjuster_tier,
+        ),
+    )
 
 
 # --- Function to list and serialize ---
@@ -173,21 +310,34 @@ async def list_claim_assessments_paginated(
     """
     skip = (page_no - 1) * page_size
 
-    result = await db.execute(select(ClaimAssessment).offset(skip).limit(page_size))
-    assessments: list[ClaimAssessment] = result.scalars().all()
-
-    # Convert DB models to simple schema
-    data = []
-    for a in assessments:
-        data.append(
-            ClaimAssessmentSimpleSchema(
-                claim_id=a.claim.claim_id,  # from Claim relationship
-                risk_level=a.risk_category.value if a.risk_category else "UNKNOWN",
-                priority=a.priority.value if a.priority else "normal",
-                adjuster_tier=[a.adjuster_tier],  # wrap string in list
-                validation_errors=None,  # populate if you store validation errors somewhere
-            )
+    result = await db.execute(
+        select(
+            Claim.claim_id,
+            ClaimAssessment.risk_category,
+            ClaimAssessment.priority,
+            ClaimAssessment.adjuster_tier,
+            ClaimAssessment.validation_errors,
+        )
+        .join(Claim, ClaimAssessment.claim_id == Claim.id)
+        .order_by(ClaimAssessment.id)
+        .offset(skip)
+        .limit(page_size)
+    )
+
+    # Rows come straight from the DB with known types, so the schemas are
+    # built without re-validation
+    data = [
+        ClaimAssessmentSimpleSchema.model_construct(
+            claim_id=row.claim_id,
+            risk_level=RISK_LEVEL_VALUES.get(row.risk_category, "UNKNOWN"),
+            priority=PRIORITY_VALUES.get(row.priority, "normal"),
+            adjuster_tier=[row.adjuster_tier],  # wrap string in list
+            validation_errors=(
+                row.validation_errors.split("; ") if row.validation_errors else None
+            ),
         )
+        for row in result
+    ]
 
     return ClaimAssessmentListSchema(page_no=page_no, page_size=page_size, data=data)
 
@@ -207,7 +357,10 @@ async def get_dashboard_data(db: AsyncSession) -> DashboardDataSchema:
             ClaimAssessment.risk_category, func.count(ClaimAssessment.id).label("count")
         ).group_by(ClaimAssessment.risk_category)
     )
-    risk_data = dict(risk_dist_result.fetchall())
+    risk_data = {
+        RISK_LEVEL_VALUES[category]: count
+        for category, count in risk_dist_result.fetchall()
+    }
 
     risk_distribution = RiskDistribution(
         low=risk_data.get("low", 0),
@@ -221,7 +374,10 @@ async def get_dashboard_data(db: AsyncSession) -> DashboardDataSchema:
             ClaimAssessment.priority, func.count(ClaimAssessment.id).label("count")
         ).group_by(ClaimAssessment.priority)
     )
-    priority_data = dict(priority_dist_result.fetchall())
+    priority_data = {
+        PRIORITY_VALUES[priority]: count
+        for priority, count in priority_dist_result.fetchall()
+    }
 
     priority_distribution = PriorityDistribution(
         normal=priority_data.get("normal", 0),
@@ -343,6 +499,7 @@ async def get_dashboard_data(db: AsyncSession) -> DashboardDataSchema:
             Claim.type,
             Claim.amount,
             Claim.date,
+            Claim.timestamp_submitted,
             ClaimAssessment.risk_category,
             ClaimAssessment.priority,
         )
@@ -358,25 +515,18 @@ async def get_dashboard_data(db: AsyncSession) -> DashboardDataSchema:
                 claim_id=row.claim_id,
                 type=row.type,
                 amount=row.amount,
-                risk_level=row.risk_category.value if row.risk_category else "unknown",
-                priority=row.priority.value if row.priority else "normal",
+                risk_level=RISK_LEVEL_VALUES.get(row.risk_category, "unknown"),
+                priority=PRIORITY_VALUES.get(row.priority, "normal"),
                 submitted_date=row.date,
+                submitted_at=row.timestamp_submitted,
             )
         )
 
     # Get top claim types
     top_claim_types = dict(claim_type_data)
 
-    # Get high risk locations
-    high_risk_locations_result = await db.execute(
-        select(Claim.incident_location)
-        .join(ClaimAssessment, Claim.id == ClaimAssessment.claim_id)
-        .where(ClaimAssessment.risk_category == "high")
-        .group_by(Claim.incident_location)
-        .order_by(desc(func.count(Claim.id)))
-        .limit(5)
-    )
-    high_risk_locations = [row[0] for row in high_risk_locations_result.fetchall()]
+    # Get high risk locations (precomputed daily hotspots of the last window)
+    high_risk_locations = await get_high_risk_locations(db)
 
     return DashboardDataSchema(
         total_claims=total_claims,
@@ -391,3 +541,141 @@ async def get_dashboard_data(db: AsyncSession) -> DashboardDataSchema:
         top_claim_types=top_claim_types,
         high_risk_locations=high_risk_locations,
     )
+
+
+# --- Live dashboard stream ---
+# Dashboard buckets of stored values, as aggregated in get_dashboard_data
+ADJUSTER_TIER_BUCKETS = {
+    "standard": "tier_1",
+    "junior": "tier_1",
+    "senior": "tier_2",
+    "fraud_specialist": "tier_3",
+}
+CLAIM_TYPE_BUCKETS = {
+    "auto": "auto",
+    "vehicle": "auto",
+    "property": "property",
+    "home": "property",
+    "health": "health",
+    "medical": "health",
+}
+
+
+def build_dashboard_delta(
+    claim_data: ClaimSchema,
+    risk_assessment: RiskAssessmentLLMSchema,
+    routing_decision: RoutingDecisionLLMSchema,
+    sequence: int,
+) -> DashboardDeltaSchema:
+    """Counter increments a newly processed claim adds to the dashboard."""
+    risk_level = RISK_LEVEL_VALUES[risk_assessment.risk_category]
+    priority = PRIORITY_VALUES[routing_decision.priority]
+    tier_bucket = ADJUSTER_TIER_BUCKETS[routing_decision.adjuster_tier.value]
+    type_bucket = CLAIM_TYPE_BUCKETS.get(claim_data.type, "other")
+    increments = {
+        "total_claims": 1,
+        "processing_stats.total_processed": 1,
+        f"risk_distribution.{risk_level}": 1,
+        f"adjuster_distribution.{tier_bucket}": 1,
+        f"claim_type_distribution.{type_bucket}": 1,
+        f"top_claim_types.{claim_data.type}": 1,
+    }
+    # same buckets as the snapshot: the submission timestamp comes from the
+    # client and may be any day, not necessarily today
+    submitted = claim_data.timestamp_submitted.date()
+    today = datetime.now().date()
+    if submitted == today:
+        increments["recent_claims.today"] = 1
+    if submitted >= today - timedelta(days=today.weekday()):
+        increments["recent_claims.this_week"] = 1
+    if submitted >= today.replace(day=1):
+        increments["recent_claims.this_month"] = 1
+    if priority in PriorityDistribution.model_fields:
+        increments[f"priority_distribution.{priority}"] = 1
+    if risk_assessment.risk_category == RiskCategory.HIGH:
+        increments["processing_stats.fraud_detected"] = 1
+
+    return DashboardDeltaSchema(
+        sequence=sequence,
+        increments=increments,
+        amount=claim_data.amount,
+        risk_score=risk_assessment.risk_score,
+        recent_activity=RecentActivity(
+            claim_id=claim_data.claim_id,
+            type=claim_data.type,
+            amount=claim_data.amount,
+            risk_level=risk_level,
+            priority=priority,
+            submitted_date=claim_data.date,
+            submitted_at=claim_data.timestamp_submitted,
+        ),
+    )
+
+
+def _sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def publish_dashboard_delta(
+    claim_data: ClaimSchema,
+    risk_assessment: RiskAssessmentLLMSchema,
+    routing_decision: RoutingDecisionLLMSchema,
+    assessment_id: int,
+) -> None:
+    """
+    Publish the delta of a committed claim, serialized once for all clients.
+    The assessment id orders the delta against snapshots: ids are never
+    reused and SQLite commits them in increasing order.
+    """
+    if not dashboard_broadcaster.subscribers:
+        return
+    delta = build_dashboard_delta(
+        claim_data, risk_assessment, routing_decision, assessment_id
+    )
+    dashboard_broadcaster.publish(
+        _sse_event("delta", delta.model_dump_json()), assessment_id
+    )
+
+
+async def _dashboard_snapshot_event() -> tuple[int, str]:
+    """
+    Snapshot event and its watermark, the newest assessment id it counts:
+    deltas at or below the watermark are already part of the snapshot.
+    """
+    async with AsyncSessionLocal() as db:
+        # one read transaction (pysqlite doesn't open one for SELECTs), so
+        # the watermark and the counts see the same committed claims
+        await db.execute(text("BEGIN"))
+        watermark = await db.scalar(select(func.max(ClaimAssessment.id))) or 0
+        snapshot = await get_dashboard_data(db)
+    return watermark, _sse_event("snapshot", snapshot.model_dump_json())
+
+
+async def dashboard_stream():
+    """
+    SSE generator of the live dashboard: one `snapshot` event, then a `delta`
+    event per processed claim. A client that falls behind its buffer gets a
+    new `snapshot` instead of the dropped deltas. Idle streams get a comment
+    line every heartbeat interval so proxies keep them open.
+    """
+    # subscribed before the snapshot is read, so no delta is missed
+    queue = dashboard_broadcaster.subscribe()
+    try:
+        watermark, snapshot = await _dashboard_snapshot_event()
+        yield snapshot
+        while True:
+            message = await dashboard_broadcaster.next_message(queue)
+            if message is None:
+                yield ": keep-alive\n\n"
+            elif message == RESYNC:
+                watermark, snapshot = await _dashboard_snapshot_event()
+                yield snapshot
+            elif message == CLOSED:
+                return
+            else:
+                sequence, event = message
+                # claims committed before the snapshot are already counted
+                if sequence > watermark:
+                    yield event
+    finally:
+        dashboard_broadcaster.unsubscribe(queue)
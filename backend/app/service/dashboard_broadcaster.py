@@ -0,0 +1,110 @@
+import asyncio
+import os
+import signal
+import threading
+from functools import partial
+from typing import Optional, Union
+
+# --- Live dashboard configuration ---
+# Events buffered per subscriber before it is switched to a resync
+DASHBOARD_CLIENT_BUFFER = int(os.getenv("DASHBOARD_CLIENT_BUFFER", "32"))
+# Seconds between keep-alive comments on an idle stream
+DASHBOARD_HEARTBEAT_SECONDS = float(os.getenv("DASHBOARD_HEARTBEAT_SECONDS", "15"))
+
+# Queue markers, sent in place of an event
+RESYNC = "resync"  # events were dropped, the client needs a new snapshot
+CLOSED = "closed"  # the broadcaster is shutting down
+
+# Signals asking the server to exit, which end the streams
+EXIT_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+class DashboardBroadcaster:
+    """
+    In-process fan-out of dashboard deltas to SSE subscribers.
+    Each subscriber owns a bounded queue, so an idle client costs one queue
+    and a suspended generator. Events are serialized once by the publisher and
+    the same string is shared by all queues. A subscriber that falls behind is
+    not allowed to grow its buffer: its pending events are dropped and replaced
+    by a RESYNC marker, after which it is sent a fresh snapshot.
+    """
+
+    def __init__(self, buffer_size: int = DASHBOARD_CLIENT_BUFFER):
+        self.buffer_size = buffer_size
+        self.subscribers: set[asyncio.Queue] = set()
+        self.closed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """
+        Accept subscribers and end them as soon as the server is asked to
+        exit, called on startup. Uvicorn only runs the lifespan shutdown once
+        every connection is closed, which a stream never does on its own, so
+        the exit signal handlers the server installed are wrapped to close
+        the streams first (the server restores its previous handlers itself).
+        """
+        self.closed = False
+        self._loop = asyncio.get_running_loop()
+        # signal handlers can only be set from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for sig in EXIT_SIGNALS:
+            handler = signal.getsignal(sig)
+            if callable(handler):
+                signal.signal(sig, partial(self._close_on_signal, handler))
+
+    def _close_on_signal(self, handler, sig, frame) -> None:
+        # runs between two bytecodes of the loop thread: schedule the close
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.close)
+        handler(sig, frame)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.buffer_size)
+        if self.closed:
+            queue.put_nowait(CLOSED)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+    def _put(self, queue: asyncio.Queue, message: Union[tuple[int, str], str]) -> None:
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
+
+    def publish(self, message: str, sequence: int) -> None:
+        """
+        Send an already serialized event to every subscriber (never blocks).
+        Subscribers get (sequence, message), the sequence telling events
+        already included in their last snapshot apart.
+        """
+        for queue in self.subscribers:
+            self._put(queue, (sequence, message))
+
+    def close(self) -> None:
+        """End all subscriptions, called on shutdown."""
+        self.closed = True
+        for queue in self.subscribers:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(CLOSED)
+
+    async def next_message(
+        self, queue: asyncio.Queue
+    ) -> Union[tuple[int, str], str, None]:
+        """
+        Next message of a subscriber: a (sequence, event) pair or a marker,
+        or None after a heartbeat interval.
+        """
+        try:
+            return await asyncio.wait_for(queue.get(), DASHBOARD_HEARTBEAT_SECONDS)
+        except asyncio.TimeoutError:
+            return None
+
+
+dashboard_broadcaster = DashboardBroadcaster()
@@ -0,0 +1,258 @@
+import csv
+import io
+import os
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator, Optional
+
+import orjson
+from fastapi import HTTPException
+from sqlalchemy import literal_column, select, union_all
+
+from app.db.database import AsyncSessionLocal
+from app.model.archive import ArchivedClaim, ArchivedClaimAssessment
+from app.model.claim_assessment import ClaimAssessment
+from app.model.claims import Claim
+from app.schema.export_schema import ExportFormat
+from app.schema.risk_schema import RiskCategory
+from app.schema.routing_decision_schema import Priority
+from app.service.claim_service import PRIORITY_VALUES, RISK_LEVEL_VALUES
+
+# Rows fetched per round-trip from the server-side cursor
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# Exported columns of the claim and of its assessment; `cursor` (the claim
+# id, unique across hot and archive tables) is the resume token of the row
+EXPORT_CLAIM_FIELDS = [
+    "claim_id",
+    "type",
+    "date",
+    "amount",
+    "description",
+    "customer_id",
+    "policy_number",
+    "incident_location",
+    "timestamp_submitted",
+    "police_report",
+    "injuries_reported",
+    "other_party_involved",
+    "customer_tenure_days",
+    "previous_claims_count",
+]
+EXPORT_ASSESSMENT_FIELDS = [
+    "risk_score",
+    "risk_category",
+    "fraud_indicators",
+    "processing_score",
+    "priority",
+    "adjuster_tier",
+]
+EXPORT_FIELD_NAMES = ["cursor"] + EXPORT_CLAIM_FIELDS + EXPORT_ASSESSMENT_FIELDS
+# Exported tables: hot claims and archived claims, with their assessments
+EXPORT_SOURCES = [(Claim, ClaimAssessment), (ArchivedClaim, ArchivedClaimAssessment)]
+
+
+def parse_export_cursor(cursor: Optional[str]) -> int:
+    """Decode the resume cursor (id of the last exported row)."""
+    if cursor is None:
+        return 0
+    try:
+        return int(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid export cursor")
+
+
+def _export_select(
+    claim_model,
+    assessment_model,
+    after_id: int,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    claim_type: Optional[str],
+    risk_category: Optional[RiskCategory],
+    priority: Optional[Priority],
+):
+    query = (
+        select(
+            claim_model.id.label("cursor"),
+            *(getattr(claim_model, name) for name in EXPORT_CLAIM_FIELDS),
+            *(getattr(assessment_model, name) for name in EXPORT_ASSESSMENT_FIELDS),
+        )
+        .outerjoin(assessment_model, claim_model.id == assessment_model.claim_id)
+        .where(claim_model.id > after_id)
+    )
+
+    # Date range on the submission date (end date inclusive)
+    if start_date:
+        query = query.where(
+            claim_model.timestamp_submitted >= datetime.combine(start_date, time.min)
+        )
+    if end_date:
+        query = query.where(
+            claim_model.timestamp_submitted
+            < datetime.combine(end_date + timedelta(days=1), time.min)
+        )
+    if claim_type:
+        query = query.where(claim_model.type == claim_type)
+    if risk_category:
+        query = query.where(assessment_model.risk_category == risk_category)
+    if priority:
+        query = query.where(assessment_model.priority == priority)
+    return query
+
+
+def build_export_query(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    claim_type: Optional[str] = None,
+    risk_category: Optional[RiskCategory] = None,
+    priority: Optional[Priority] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+):
+    """
+    Keyset-paginated export query over hot and archived claims, ordered by
+    claim id, so an interrupted export resumes from the last received
+    `cursor` without OFFSET scans.
+    """
+    after_id = parse_export_cursor(cursor)
+    query = union_all(
+        *(
+            _export_select(
+                claim_model,
+                assessment_model,
+                after_id,
+                start_date,
+                end_date,
+                claim_type,
+                risk_category,
+                priority,
+            )
+            for claim_model, assessment_model in EXPORT_SOURCES
+        )
+    ).order_by(literal_column("cursor"))
+    if limit:
+        query = query.limit(limit)
+    return query.execution_options(stream_results=True, yield_per=EXPORT_CHUNK_SIZE)
+
+
+def _row_values(row) -> dict:
+    values = row._asdict()
+    values["cursor"] = str(values["cursor"])
+    values["risk_category"] = RISK_LEVEL_VALUES.get(values["risk_category"])
+    values["priority"] = PRIORITY_VALUES.get(values["priority"])
+    return values
+
+
+# --- Format encoders: each turns one chunk of rows into bytes ---
+def _encode_ndjson(rows: list) -> bytes:
+    return b"".join(orjson.dumps(_row_values(row)) + b"\n" for row in rows)
+
+
+def _encode_csv(rows: list) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELD_NAMES)
+    writer.writerows(_row_values(row) for row in rows)
+    return buffer.getvalue().encode()
+
+
+def _csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=EXPORT_FIELD_NAMES).writeheader()
+    return buffer.getvalue().encode()
+
+
+class _ParquetChunkWriter:
+    """Writes one Parquet row group per chunk and hands back the new bytes."""
+
+    def __init__(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        self.schema = pa.schema(
+            [
+                ("cursor", pa.string()),
+                ("claim_id", pa.string()),
+                ("type", pa.string()),
+                ("date", pa.date32()),
+                ("amount", pa.float64()),
+                ("description", pa.string()),
+                ("customer_id", pa.string()),
+                ("policy_number", pa.string()),
+                ("incident_location", pa.string()),
+                ("timestamp_submitted", pa.timestamp("us")),
+                ("police_report", pa.string()),
+                ("injuries_reported", pa.bool_()),
+                ("other_party_involved", pa.bool_()),
+                ("customer_tenure_days", pa.int64()),
+                ("previous_claims_count", pa.int64()),
+                ("risk_score", pa.int64()),
+                ("risk_category", pa.string()),
+                ("fraud_indicators", pa.string()),
+                ("processing_score", pa.int64()),
+                ("priority", pa.string()),
+                ("adjuster_tier", pa.string()),
+            ]
+        )
+        self.sink = io.BytesIO()
+        self.writer = pq.ParquetWriter(self.sink, self.schema)
+
+    def _drain(self) -> bytes:
+        data = self.sink.getvalue()
+        self.sink.seek(0)
+        self.sink.truncate()
+        return data
+
+    def write(self, rows: list) -> bytes:
+        table = self.pa.Table.from_pylist(
+            [_row_values(row) for row in rows], schema=self.schema
+        )
+        self.writer.write_table(table)
+        return self._drain()
+
+    def close(self) -> bytes:
+        self.writer.close()
+        return self._drain()
+
+
+def ensure_export_format_available(export_format: ExportFormat) -> None:
+    """Fail fast (before streaming starts) when an optional dependency is missing."""
+    if export_format == ExportFormat.PARQUET:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(
+                status_code=400,
+                detail="Parquet export requires pyarrow to be installed",
+            )
+
+
+async def stream_claims_export(
+    export_format: ExportFormat, **filters
+) -> AsyncIterator[bytes]:
+    """
+    Stream claims (hot and archived) joined with their assessments in the
+    requested format.
+    Rows are read through a server-side cursor in EXPORT_CHUNK_SIZE partitions,
+    so memory stays flat regardless of table size. The session is owned by the
+    generator because it must outlive the request handler.
+    """
+    query = build_export_query(**filters)
+    parquet_writer = (
+        _ParquetChunkWriter() if export_format == ExportFormat.PARQUET else None
+    )
+    if export_format == ExportFormat.CSV:
+        yield _csv_header()
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query)
+        async for rows in result.partitions(EXPORT_CHUNK_SIZE):
+            if export_format == ExportFormat.NDJSON:
+                yield _encode_ndjson(rows)
+            elif export_format == ExportFormat.CSV:
+                yield _encode_csv(rows)
+            else:
+                yield parquet_writer.write(rows)
+
+    if parquet_writer is not None:
+        yield parquet_writer.close()
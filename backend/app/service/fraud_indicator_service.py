@@ -0,0 +1,270 @@
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import desc, exists, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.archive import ArchivedClaim, ArchivedClaimAssessment
+from app.model.claim_assessment import ClaimAssessment
+from app.model.claims import Claim
+from app.model.fraud_indicator import ClaimFraudIndicator, FraudIndicator
+from app.schema.fraud_indicator_schema import (
+    FraudIndicatorClaimsSchema,
+    FraudIndicatorCountSchema,
+    FraudIndicatorTrendSchema,
+)
+
+# --- Canonicalization of LLM phrasings ---
+# Filler words that don't change what an indicator means
+STOPWORDS = set(
+    "a an the of for in on at to with and or is was are be been very possible "
+    "possibly potential potentially likely sign indicator detected noted observed".split()
+)
+# Word-level synonyms the LLM alternates between
+SYNONYMS = {
+    "recent": "new",
+    "recently": "new",
+    "newly": "new",
+    "delayed": "late",
+    "delay": "late",
+    "large": "high",
+    "excessive": "high",
+    "unusually": "high",
+    "unusual": "high",
+    "big": "high",
+    "elevated": "high",
+    "value": "amount",
+    "cost": "amount",
+    "sum": "amount",
+    "multiple": "many",
+    "numerous": "many",
+    "frequent": "many",
+    "missing": "no",
+    "absent": "no",
+    "lack": "no",
+    "without": "no",
+    "vehicle": "car",
+    "auto": "car",
+}
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _stem(token: str) -> str:
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+@lru_cache(maxsize=4096)
+def canonicalize_indicator(indicator: str) -> str:
+    """
+    Canonical key of an indicator phrasing, so that e.g. "High claim amount",
+    "claim amount is unusually high" and "large claim amounts" share one key.
+    """
+    tokens = {
+        _stem(SYNONYMS.get(token, token))
+        for token in TOKEN_PATTERN.findall(indicator.lower())
+        if token not in STOPWORDS
+    }
+    return " ".join(sorted(tokens))
+
+
+def _split_indicators(fraud_indicators: Optional[str]) -> list[str]:
+    return [
+        item.strip() for item in (fraud_indicators or "").split(",") if item.strip()
+    ]
+
+
+async def link_fraud_indicators(
+    db: AsyncSession,
+    claim_id: int,
+    indicators: Iterable[str],
+    flagged_at: datetime,
+) -> None:
+    """
+    Store the indicators of a claim in the dictionary and link table.
+    Runs inside the caller's transaction; unknown keys are inserted with
+    ON CONFLICT DO NOTHING so concurrent writers can't collide.
+    """
+    labels = {}
+    for indicator in indicators:
+        key = canonicalize_indicator(indicator)
+        if key:
+            labels.setdefault(key, indicator.strip())
+    if not labels:
+        return
+
+    await db.execute(
+        insert(FraudIndicator)
+        .values(
+            [
+                {"key": key, "label": label, "created_at": datetime.now()}
+                for key, label in labels.items()
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["key"])
+    )
+    result = await db.execute(
+        select(FraudIndicator.id).where(FraudIndicator.key.in_(labels))
+    )
+    await db.execute(
+        insert(ClaimFraudIndicator)
+        .values(
+            [
+                {
+                    "claim_id": claim_id,
+                    "indicator_id": indicator_id,
+                    "flagged_at": flagged_at,
+                }
+                for indicator_id in result.scalars().all()
+            ]
+        )
+        .on_conflict_do_nothing()
+    )
+
+
+async def backfill_fraud_indicators(db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    Populate the indicator tables from the comma-joined `fraud_indicators`
+    column of hot and archived assessments that have no links yet, one
+    transaction per batch. Returns the number of backfilled assessments.
+    """
+    total = 0
+    # archived claims keep their id, so links of both tables never collide
+    for claim_model, assessment_model in (
+        (Claim, ClaimAssessment),
+        (ArchivedClaim, ArchivedClaimAssessment),
+    ):
+        last_id = 0
+        while True:
+            async with db.begin():
+                result = await db.execute(
+                    select(
+                        assessment_model.id,
+                        assessment_model.claim_id,
+                        assessment_model.fraud_indicators,
+                        claim_model.timestamp_submitted,
+                    )
+                    .join(claim_model, claim_model.id == assessment_model.claim_id)
+                    .where(
+                        assessment_model.id > last_id,
+                        assessment_model.fraud_indicators.is_not(None),
+                        ~exists().where(
+                            ClaimFraudIndicator.claim_id == assessment_model.claim_id
+                        ),
+                    )
+                    .order_by(assessment_model.id)
+                    .limit(batch_size)
+                )
+                rows = result.all()
+                for row in rows:
+                    await link_fraud_indicators(
+                        db,
+                        row.claim_id,
+                        _split_indicators(row.fraud_indicators),
+                        row.timestamp_submitted,
+                    )
+
+            total += len(rows)
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1].id
+    return total
+
+
+def _indicator_counts(start: datetime, end: Optional[datetime] = None):
+    query = select(
+        ClaimFraudIndicator.indicator_id,
+        func.count(ClaimFraudIndicator.claim_id).label("count"),
+    ).where(ClaimFraudIndicator.flagged_at >= start)
+    if end is not None:
+        query = query.where(ClaimFraudIndicator.flagged_at < end)
+    return query.group_by(ClaimFraudIndicator.indicator_id)
+
+
+async def get_top_fraud_indicators(
+    db: AsyncSession, window_days: int = 30, limit: int = 10
+) -> FraudIndicatorTrendSchema:
+    """
+    Top indicators flagged in the last `window_days`, with their count in the
+    previous window of the same length to show what is trending.
+    """
+    since = datetime.now() - timedelta(days=window_days)
+    current = _indicator_counts(since).subquery()
+    result = await db.execute(
+        select(
+            FraudIndicator.id, FraudIndicator.key, FraudIndicator.label, current.c.count
+        )
+        .join(current, current.c.indicator_id == FraudIndicator.id)
+        .order_by(desc(current.c.count), FraudIndicator.key)
+        .limit(limit)
+    )
+    top = result.all()
+
+    previous_counts = {}
+    if top:
+        previous = _indicator_counts(since - timedelta(days=window_days), since)
+        result = await db.execute(
+            previous.where(
+                ClaimFraudIndicator.indicator_id.in_([row.id for row in top])
+            )
+        )
+        previous_counts = dict(result.all())
+
+    return FraudIndicatorTrendSchema(
+        window_days=window_days,
+        since=since,
+        data=[
+            FraudIndicatorCountSchema(
+                key=row.key,
+                label=row.label,
+                count=row.count,
+                previous_count=previous_counts.get(row.id, 0),
+            )
+            for row in top
+        ],
+    )
+
+
+async def get_claims_for_fraud_indicator(
+    db: AsyncSession, indicator: str, limit: int = 100
+) -> FraudIndicatorClaimsSchema:
+    """
+    Claims flagged for an indicator (canonical key or any phrasing of it),
+    most recent first, across hot and archived claims.
+    """
+    result = await db.execute(
+        select(FraudIndicator).where(
+            FraudIndicator.key == canonicalize_indicator(indicator)
+        )
+    )
+    fraud_indicator = result.scalars().first()
+    if not fraud_indicator:
+        raise HTTPException(status_code=404, detail="Fraud indicator not found")
+
+    links = (
+        select(ClaimFraudIndicator.claim_id, ClaimFraudIndicator.flagged_at)
+        .where(ClaimFraudIndicator.indicator_id == fraud_indicator.id)
+        .order_by(desc(ClaimFraudIndicator.flagged_at))
+        .limit(limit)
+        .subquery()
+    )
+    claim_ids = []
+    for model in (Claim, ArchivedClaim):
+        result = await db.execute(
+            select(model.claim_id, links.c.flagged_at).join(
+                links, links.c.claim_id == model.id
+            )
+        )
+        claim_ids.extend(result.all())
+    claim_ids.sort(key=lambda row: row.flagged_at, reverse=True)
+
+    return FraudIndicatorClaimsSchema(
+        key=fraud_indicator.key,
+        label=fraud_indicator.label,
+        claim_ids=[row.claim_id for row in claim_ids[:limit]],
+    )
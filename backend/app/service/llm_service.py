@@ -1,9 +1,256 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
-from dotenv import load_dotenv
+import asyncio
+import os
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.config import load_env
+from app.schema.llm_schema import AgentConfigSchema, LLMCallSchema
+from app.service.output_repair_service import repair_stats, repair_structured_output
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
 
 # --- LLM setup ---
-llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
+LLM_MODEL = os.getenv("LLM_MODEL", "gemini-2.0-flash")
+LLM_WARMUP = os.getenv("LLM_WARMUP", "false").lower() == "true"
+# Re-prompts allowed when the output can't be repaired locally
+LLM_MAX_REPROMPTS = int(os.getenv("LLM_MAX_REPROMPTS", "1"))
+
+# --- Request hedging ---
+# Fire a second identical request when the first is slower than the
+# LLM_HEDGE_PERCENTILE of recent latencies; the first response wins
+LLM_HEDGING = os.getenv("LLM_HEDGING", "false").lower() == "true"
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.9"))
+# Max fraction of calls that may be hedged (extra LLM cost)
+LLM_HEDGE_BUDGET = float(os.getenv("LLM_HEDGE_BUDGET", "0.1"))
+# Latencies kept per (schema, model), and needed before hedging starts
+LLM_LATENCY_WINDOW = int(os.getenv("LLM_LATENCY_WINDOW", "200"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+# Call lists of the active recorders, innermost last, see `record_llm_calls`
+_llm_calls: ContextVar[tuple] = ContextVar("llm_calls", default=())
+
+# Recent single-request latencies (seconds) per (pool, schema name, model).
+# The pool is "production", or "candidate" for replay and shadow configs, so
+# candidate runs never move the production hedge thresholds
+_latencies: dict[tuple, deque] = defaultdict(lambda: deque(maxlen=LLM_LATENCY_WINDOW))
+# Per pool: counts of calls, hedges and hedge wins, plus the estimated ms saved
+hedge_stats: dict[str, Counter] = defaultdict(Counter)
+
+
+@lru_cache(maxsize=None)
+def get_llm(model: str = LLM_MODEL, temperature: Optional[float] = None):
+    """
+    Build the chat model on first use and memoize it.
+    The Gemini client is imported here so that importing the app stays cheap
+    and read-only endpoints work without an API key.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    if temperature is None:
+        return ChatGoogleGenerativeAI(model=model)
+    return ChatGoogleGenerativeAI(model=model, temperature=temperature)
+
+
+@lru_cache(maxsize=None)
+def get_structured_llm(
+    schema: type, model: str = LLM_MODEL, temperature: Optional[float] = None
+):
+    """
+    Memoized chat model bound to a structured output schema.
+    The raw message is kept alongside the parsed output for token accounting.
+    """
+    return get_llm(model, temperature).with_structured_output(schema, include_raw=True)
+
+
+@lru_cache(maxsize=None)
+def get_prompt_template(template: str):
+    """Memoized ChatPromptTemplate for a prompt string."""
+    from langchain_core.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_template(template)
+
+
+def warm_up_llm() -> None:
+    """Eagerly build the clients used by the agents (called at startup)."""
+    from app.schema.risk_schema import RiskAssessmentLLMSchema
+    from app.schema.routing_decision_schema import RoutingDecisionLLMSchema
+
+    get_structured_llm(RiskAssessmentLLMSchema)
+    get_structured_llm(RoutingDecisionLLMSchema)
+
+
+@contextmanager
+def record_llm_calls(inherit: bool = True):
+    """
+    Collect a LLMCallSchema for every structured LLM call made in this context
+    (including tasks and threads started from it). Calls are also collected
+    by the enclosing recorders (e.g. a request profile around timeline
+    stages), unless `inherit` is False for background work that must not be
+    attributed to the request that started it.
+    """
+    calls: list[LLMCallSchema] = []
+    token = _llm_calls.set((_llm_calls.get() if inherit else ()) + (calls,))
+    try:
+        yield calls
+    finally:
+        _llm_calls.reset(token)
+
+
+def _hedge_delay(latencies: deque) -> Optional[float]:
+    """Seconds to wait before hedging, None if hedging is off or unwarranted."""
+    if not LLM_HEDGING or len(latencies) < LLM_HEDGE_MIN_SAMPLES:
+        return None
+    ordered = sorted(latencies)
+    return ordered[min(int(len(ordered) * LLM_HEDGE_PERCENTILE), len(ordered) - 1)]
+
+
+async def _timed_ainvoke(llm, messages: list) -> tuple[dict, float]:
+    start = time.perf_counter()
+    response = await llm.ainvoke(messages)
+    return response, time.perf_counter() - start
+
+
+async def _ainvoke_hedged(llm, messages: list, key: tuple) -> tuple[dict, bool]:
+    """
+    Invoke the LLM, hedging stragglers: if no response arrived after the
+    adaptive delay (and the hedge budget allows it), an identical request is
+    fired, the first successful response wins and the other one is cancelled.
+    Returns the response and whether a hedge was fired.
+    """
+    latencies, stats = _latencies[key], hedge_stats[key[0]]
+    delay = _hedge_delay(latencies)
+    stats["calls"] += 1
+    start = time.perf_counter()
+    primary = asyncio.ensure_future(_timed_ainvoke(llm, messages))
+    pending, hedged = {primary}, False
+    try:
+        if delay is not None:
+            await asyncio.wait(pending, timeout=delay)
+            budget = LLM_HEDGE_BUDGET * stats["calls"]
+            if not primary.done() and stats["hedged"] < budget:
+                stats["hedged"] += 1
+                hedged = True
+                pending.add(asyncio.ensure_future(_timed_ainvoke(llm, messages)))
+
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # the first request wins ties
+            for task in sorted(done, key=lambda task: task is not primary):
+                if task.exception() is not None:
+                    error = error or task.exception()
+                    continue
+                response, latency = task.result()
+                if task is primary:
+                    latencies.append(latency)
+                else:
+                    # the cancelled first request had already run this long
+                    # without answering: a lower bound of its latency, kept
+                    # so that stragglers still weigh on the threshold
+                    primary_elapsed = time.perf_counter() - start
+                    latencies.append(primary_elapsed)
+                    stats["hedge_wins"] += 1
+                    stats["saved_ms"] += 1000 * (primary_elapsed - latency)
+                return response, hedged
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def invoke_structured(
+    schema: type[BaseModel],
+    messages: list,
+    config: Optional[AgentConfigSchema] = None,
+) -> BaseModel:
+    """
+    Invoke the LLM with structured output for `schema` and record the call.
+    Slow calls are hedged when LLM_HEDGING is on, see `_ainvoke_hedged`.
+    Output that fails validation is first repaired in-process; the LLM is only
+    re-prompted (up to LLM_MAX_REPROMPTS times) when the repair fails.
+    """
+    model = (config and config.model) or LLM_MODEL
+    temperature = config.temperature if config else None
+    llm = get_structured_llm(schema, model, temperature)
+    pool = "candidate" if config else "production"
+
+    for attempt in range(1, LLM_MAX_REPROMPTS + 2):
+        start = time.perf_counter()
+        response, hedged = await _ainvoke_hedged(
+            llm, messages, (pool, schema.__name__, model)
+        )
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        parsed = response["parsed"]
+        repaired = False
+        if response["parsing_error"] is not None or parsed is None:
+            parsed = repair_structured_output(schema, response["raw"])
+            repaired = parsed is not None
+
+        usage = getattr(response["raw"], "usage_metadata", None) or {}
+        recorders = _llm_calls.get()
+        if recorders:
+            call = LLMCallSchema(
+                schema_name=schema.__name__,
+                model=model,
+                latency_ms=round(latency_ms, 3),
+                input_tokens=usage.get("input_tokens"),
+                output_tokens=usage.get("output_tokens"),
+                cached_tokens=(usage.get("input_token_details") or {}).get(
+                    "cache_read"
+                ),
+                attempt=attempt,
+                repaired=repaired,
+                hedged=hedged,
+            )
+            for calls in recorders:
+                calls.append(call)
+
+        if parsed is not None:
+            return parsed
+        if attempt <= LLM_MAX_REPROMPTS:
+            repair_stats[f"{schema.__name__}.reprompted"] += 1
+
+    if response["parsing_error"] is not None:
+        raise response["parsing_error"]
+    raise ValueError(f"LLM returned no valid {schema.__name__} output")
+
+
+def _hedging_metrics(pool: str) -> dict:
+    stats = hedge_stats[pool]
+    calls = stats["calls"]
+    return {
+        "calls": calls,
+        "hedged": stats["hedged"],
+        "hedge_rate": stats["hedged"] / calls if calls else 0.0,
+        "hedge_wins": stats["hedge_wins"],
+        "estimated_latency_saved_ms": round(stats["saved_ms"], 3),
+        "thresholds_ms": {
+            f"{schema_name}:{model}": round(delay * 1000, 3)
+            for (key_pool, schema_name, model), latencies in _latencies.items()
+            if key_pool == pool and (delay := _hedge_delay(latencies)) is not None
+        },
+    }
+
+
+def get_llm_metrics() -> dict:
+    """Counters of the structured LLM layer (repairs, re-prompts and hedging)."""
+    return {
+        "repairs": dict(repair_stats),
+        "hedging": {
+            "enabled": LLM_HEDGING,
+            **_hedging_metrics("production"),
+            # replay and shadow runs, kept apart from production traffic
+            "candidate": _hedging_metrics("candidate"),
+        },
+    }
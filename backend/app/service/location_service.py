@@ -0,0 +1,165 @@
+import os
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+
+from sqlalchemy import delete, desc, func, insert, select, union_all, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.archive import ArchivedClaim, ArchivedClaimAssessment
+from app.model.claim_assessment import ClaimAssessment
+from app.model.claims import Claim
+from app.model.location_hotspot import LocationHotspot
+from app.schema.risk_schema import RiskCategory
+
+# --- Hotspot configuration ---
+# Days of high risk claims counted in the dashboard hotspots
+HOTSPOT_WINDOW_DAYS = int(os.getenv("HOTSPOT_WINDOW_DAYS", "30"))
+
+# --- Canonicalization of free-text locations ---
+# Address words and their canonical (USPS style) abbreviation
+ADDRESS_ABBREVIATIONS = {
+    "street": "st",
+    "str": "st",
+    "avenue": "ave",
+    "av": "ave",
+    "road": "rd",
+    "boulevard": "blvd",
+    "drive": "dr",
+    "lane": "ln",
+    "court": "ct",
+    "place": "pl",
+    "highway": "hwy",
+    "parkway": "pkwy",
+    "square": "sq",
+    "terrace": "ter",
+    "north": "n",
+    "south": "s",
+    "east": "e",
+    "west": "w",
+    "northeast": "ne",
+    "northwest": "nw",
+    "southeast": "se",
+    "southwest": "sw",
+    "saint": "st",
+    "mount": "mt",
+    "fort": "ft",
+}
+# Unit designators; the designator and its number don't change the location
+UNIT_PATTERN = re.compile(
+    r"\b(?:apt|apartment|unit|suite|ste|floor|room|rm)\b\.?\s*#?\s*\w+|#\s*\w+"
+)
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_location(location: str) -> str:
+    """
+    Canonical key of an incident location, so that e.g.
+    "123 Main St, Springfield" and "123 main street springfield" share one key.
+    Word order is kept (street, then city); case, punctuation, unit numbers and
+    street type / direction spellings are normalized.
+    """
+    text = UNIT_PATTERN.sub(" ", location.lower())
+    return " ".join(
+        ADDRESS_ABBREVIATIONS.get(token, token) for token in TOKEN_PATTERN.findall(text)
+    )
+
+
+async def record_high_risk_location(
+    db: AsyncSession, location_key: str, label: str, day: date
+) -> None:
+    """
+    Count a high risk claim in its location's daily hotspot bucket.
+    Runs inside the caller's transaction as a single upsert.
+    """
+    await db.execute(
+        sqlite_insert(LocationHotspot)
+        .values(location_key=location_key, day=day, high_risk_count=1, label=label)
+        .on_conflict_do_update(
+            index_elements=["location_key", "day"],
+            set_={"high_risk_count": LocationHotspot.high_risk_count + 1},
+        )
+    )
+
+
+async def get_high_risk_locations(
+    db: AsyncSession, window_days: int = HOTSPOT_WINDOW_DAYS, limit: int = 5
+) -> list[str]:
+    """Locations with the most high risk claims in the last `window_days`."""
+    since = date.today() - timedelta(days=window_days)
+    result = await db.execute(
+        select(func.max(LocationHotspot.label))
+        .where(LocationHotspot.day >= since)
+        .group_by(LocationHotspot.location_key)
+        .order_by(desc(func.sum(LocationHotspot.high_risk_count)))
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def backfill_locations(db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    Fill `location_key` of hot and archived claims stored before it existed
+    (one transaction per batch), then rebuild the hotspot buckets from the
+    hot and archived assessments. Returns the number of backfilled claims.
+    """
+    total = 0
+    for model in (Claim, ArchivedClaim):
+        while True:
+            async with db.begin():
+                result = await db.execute(
+                    select(model.id, model.incident_location)
+                    .where(model.location_key.is_(None))
+                    .limit(batch_size)
+                )
+                rows = result.all()
+                if rows:
+                    await db.execute(
+                        update(model),
+                        [
+                            {
+                                "id": row.id,
+                                "location_key": normalize_location(
+                                    row.incident_location
+                                ),
+                            }
+                            for row in rows
+                        ],
+                    )
+            total += len(rows)
+            if len(rows) < batch_size:
+                break
+
+    # hot and archived claims: a claim may be archived (e.g. once closed)
+    # while its submission day is still inside a hotspot window
+    high_risk = union_all(
+        *(
+            select(
+                claim.location_key,
+                func.date(claim.timestamp_submitted).label("day"),
+                claim.incident_location,
+            )
+            .join(assessment, claim.id == assessment.claim_id)
+            .where(assessment.risk_category == RiskCategory.HIGH)
+            for claim, assessment in (
+                (Claim, ClaimAssessment),
+                (ArchivedClaim, ArchivedClaimAssessment),
+            )
+        )
+    ).subquery()
+    async with db.begin():
+        await db.execute(delete(LocationHotspot))
+        await db.execute(
+            insert(LocationHotspot).from_select(
+                ["location_key", "day", "high_risk_count", "label"],
+                select(
+                    high_risk.c.location_key,
+                    high_risk.c.day,
+                    func.count(),
+                    func.min(high_risk.c.incident_location),
+                ).group_by(high_risk.c.location_key, high_risk.c.day),
+            )
+        )
+    return total
@@ -0,0 +1,184 @@
+import json
+import re
+import typing
+from collections import Counter
+from enum import Enum
+from typing import Any, Optional
+
+from annotated_types import Ge, Le
+from pydantic import BaseModel, ValidationError
+
+from app.schema.risk_schema import RiskCategory
+from app.schema.routing_decision_schema import AdjusterTier, Priority
+
+# --- Alias maps for enum values the LLM commonly gets wrong ---
+# Keys are normalized with `_normalize_token` (lowercase, "_" separators)
+ENUM_ALIASES: dict[type[Enum], dict[str, Enum]] = {
+    RiskCategory: {
+        "moderate": RiskCategory.MEDIUM,
+        "med": RiskCategory.MEDIUM,
+        "critical": RiskCategory.HIGH,
+        "severe": RiskCategory.HIGH,
+        "very_high": RiskCategory.HIGH,
+        "very_low": RiskCategory.LOW,
+        "minimal": RiskCategory.LOW,
+    },
+    Priority: {
+        # the schema has no "low"/"normal" level, both map to the default level
+        "low": Priority.MEDIUM,
+        "normal": Priority.MEDIUM,
+        "standard": Priority.MEDIUM,
+        "high": Priority.URGENT,
+        "critical": Priority.URGENT,
+        "immediate": Priority.URGENT,
+    },
+    AdjusterTier: {
+        "specialist": AdjusterTier.FRAUD_SPECIALIST,
+        "fraud": AdjusterTier.FRAUD_SPECIALIST,
+        "fraud_investigator": AdjusterTier.FRAUD_SPECIALIST,
+        "siu": AdjusterTier.FRAUD_SPECIALIST,
+        "tier_1": AdjusterTier.JUNIOR,
+        "tier_2": AdjusterTier.SENIOR,
+        "tier_3": AdjusterTier.FRAUD_SPECIALIST,
+        "mid": AdjusterTier.STANDARD,
+        "regular": AdjusterTier.STANDARD,
+    },
+}
+
+# Field names the LLM uses instead of the schema ones
+FIELD_ALIASES = {
+    "risk_level": "risk_category",
+    "category": "risk_category",
+    "score": "risk_score",
+    "processing_readiness_score": "processing_score",
+    "readiness_score": "processing_score",
+    "indicators": "fraud_indicators",
+    "tier": "adjuster_tier",
+    "priority_level": "priority",
+}
+
+JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+
+# Counts of repairs by "<schema>.<fix>", plus reprompts and failures
+repair_stats: Counter = Counter()
+
+
+def _normalize_token(value: str) -> str:
+    return re.sub(r"[\s\-]+", "_", value.strip().lower())
+
+
+def _message_text(raw: Any) -> str:
+    """Text content of a raw chat message (Gemini may return content parts)."""
+    content = getattr(raw, "content", raw)
+    if isinstance(content, list):
+        return "".join(
+            part.get("text", "") if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    return content if isinstance(content, str) else ""
+
+
+def extract_json_object(raw: Any) -> Optional[dict]:
+    """
+    Leniently extract a JSON object from a raw LLM message: tool call
+    arguments, fenced ```json blocks or the outermost {...} in free text.
+    """
+    for tool_call in getattr(raw, "tool_calls", None) or []:
+        if isinstance(tool_call.get("args"), dict):
+            return tool_call["args"]
+
+    text = _message_text(raw)
+    candidates = JSON_FENCE_PATTERN.findall(text)
+    start, end = text.find("{"), text.rfind("}")
+    if start != -1 and end > start:
+        candidates.append(text[start : end + 1])
+
+    for candidate in candidates:
+        try:
+            value = json.loads(candidate)
+        except ValueError:
+            # tolerate trailing commas, the most common syntax slip
+            try:
+                value = json.loads(re.sub(r",\s*([}\]])", r"\1", candidate))
+            except ValueError:
+                continue
+        if isinstance(value, dict):
+            return value
+    return None
+
+
+def _repair_enum(enum_cls: type[Enum], value: Any) -> Optional[Enum]:
+    if not isinstance(value, str):
+        return None
+    token = _normalize_token(value)
+    for member in enum_cls:
+        if token == member.value or token == member.name.lower():
+            return member
+    return ENUM_ALIASES.get(enum_cls, {}).get(token)
+
+
+def _repair_int(value: Any, metadata: list) -> Optional[int]:
+    if isinstance(value, str):
+        match = NUMBER_PATTERN.search(value)  # "7/10", "score: 8"
+        value = float(match.group()) if match else None
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return None
+    number = round(value)
+    for constraint in metadata:
+        if isinstance(constraint, Ge):
+            number = max(number, constraint.ge)
+        elif isinstance(constraint, Le):
+            number = min(number, constraint.le)
+    return number
+
+
+def repair_structured_output(schema: type[BaseModel], raw: Any) -> Optional[BaseModel]:
+    """
+    Repair a raw LLM message that failed to validate against `schema`:
+    extract the JSON, rename aliased fields, map enum aliases, clamp scores to
+    their bounds and split comma separated lists. Returns None if the output
+    still does not validate, in which case the caller re-prompts.
+    """
+    data = extract_json_object(raw)
+    if data is None:
+        repair_stats[f"{schema.__name__}.unparseable"] += 1
+        return None
+
+    fixes = []
+    data = {
+        FIELD_ALIASES.get(_normalize_token(k), _normalize_token(k)): v
+        for k, v in data.items()
+    }
+    for name, field in schema.model_fields.items():
+        if name not in data:
+            continue
+        value, annotation = data[name], field.annotation
+
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            if not isinstance(value, annotation):
+                repaired = _repair_enum(annotation, value)
+                if repaired is not None and repaired.value != value:
+                    data[name] = repaired
+                    fixes.append("enum_alias")
+        elif annotation is int:
+            repaired = _repair_int(value, field.metadata)
+            if repaired is not None and repaired != value:
+                data[name] = repaired
+                fixes.append("score_clamped")
+        elif typing.get_origin(annotation) is list and isinstance(value, str):
+            data[name] = [
+                item.strip() for item in re.split(r"[,\n;]", value) if item.strip()
+            ]
+            fixes.append("list_split")
+
+    try:
+        result = schema.model_validate(data)
+    except ValidationError:
+        repair_stats[f"{schema.__name__}.unrepairable"] += 1
+        return None
+
+    repair_stats[f"{schema.__name__}.repaired"] += 1
+    for fix in fixes:
+        repair_stats[f"{schema.__name__}.{fix}"] += 1
+    return result
@@ -0,0 +1,224 @@
+import asyncio
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.config import load_env
+from app.service.llm_service import record_llm_calls
+
+# Load environment variables from .env file
+load_env()
+
+
+# --- Profiling configuration ---
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_DIR = Path(os.getenv("PROFILING_DIR", "./profiles"))
+PROFILING_MAX_REPORTS = int(os.getenv("PROFILING_MAX_REPORTS", "50"))
+PROFILING_HEADER = b"x-profile"
+
+# Paths that are never profiled: the admin endpoints serving the reports and
+# long-lived streams, which would keep cProfile on the event loop (and the
+# profile lock) for the whole connection
+EXCLUDED_PATH_PREFIXES = (
+    "/admin/profiles",
+    "/claims/dashboard/stream",
+    "/claims/export",
+)
+
+# Source path fragments used to attribute profiled CPU time to a stage.
+# LLM wait is off-CPU and invisible to cProfile: it is measured from the
+# request's recorded LLM calls instead (`llm_wait` in the report)
+PROFILE_CATEGORIES = {
+    "pydantic_validation": ("pydantic",),
+    "sqlalchemy_hydration": ("sqlalchemy/orm", "sqlalchemy/engine/result"),
+    "prompt_building": ("langchain_core/prompts",),
+    "llm_client": ("langchain_google_genai", "google/genai", "httpx", "httpcore"),
+}
+
+REPORT_ID_PATTERN = re.compile(r"^[0-9]{8}T[0-9]{12}-[0-9a-f]{8}$")
+
+# cProfile can only profile one request at a time per thread
+_profile_lock = threading.Lock()
+_store_lock = threading.Lock()
+
+# Requests in flight on this worker, and how many of them overlapped the
+# profile being recorded (cProfile sees every coroutine on the event loop)
+_in_flight = 0
+_overlapping = 0
+
+
+def _should_profile(scope) -> bool:
+    """Decide whether a request is profiled (opt-in header or sampling rate)."""
+    if not PROFILING_ENABLED:
+        return False
+    if scope["path"].startswith(EXCLUDED_PATH_PREFIXES):
+        return False
+    for name, value in scope.get("headers", []):
+        if name == PROFILING_HEADER and value.lower() in (b"1", b"true"):
+            return True
+    return PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE
+
+
+def _matches(func: tuple, fragments: tuple) -> bool:
+    filename, _, name = func
+    if filename == "~":
+        # C functions (e.g. pydantic_core validators) only have a qualified name
+        return any(fragment.replace("/", ".") in name for fragment in fragments)
+    filename = filename.replace("\\", "/")
+    return any(fragment in filename for fragment in fragments)
+
+
+def summarize_profile(stats: pstats.Stats) -> dict:
+    """
+    Attribute own time (ms, excluding callees) of every profiled function to
+    the first matching category in PROFILE_CATEGORIES. Each function's own
+    time is counted once, so categories never overlap nor exceed the total.
+    """
+    summary = dict.fromkeys(PROFILE_CATEGORIES, 0.0)
+    for func, (_, _, own_time, _, _) in stats.stats.items():
+        for category, fragments in PROFILE_CATEGORIES.items():
+            if _matches(func, fragments):
+                summary[category] += own_time
+                break
+    return {category: round(total * 1000, 3) for category, total in summary.items()}
+
+
+def _save_profile_report(
+    profiler: cProfile.Profile, metadata: dict, llm_calls: list
+) -> dict:
+    """Write a report to the ring buffer and evict the oldest beyond the limit."""
+    stats = pstats.Stats(profiler)
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    report_id = f"{timestamp}-{uuid.uuid4().hex[:8]}"
+    categories = summarize_profile(stats)
+    # LLM call latency minus the client's CPU time already counted above
+    llm_latency_ms = sum(call.latency_ms for call in llm_calls)
+    categories["llm_wait"] = round(max(llm_latency_ms - categories["llm_client"], 0), 3)
+    metadata = {
+        "report_id": report_id,
+        **metadata,
+        "llm_calls": len(llm_calls),
+        "categories_ms": categories,
+    }
+
+    with _store_lock:
+        PROFILING_DIR.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(PROFILING_DIR / f"{report_id}.prof")
+        (PROFILING_DIR / f"{report_id}.json").write_text(json.dumps(metadata))
+
+        reports = sorted(PROFILING_DIR.glob("*.json"))
+        for stale in reports[: max(len(reports) - PROFILING_MAX_REPORTS, 0)]:
+            stale.unlink(missing_ok=True)
+            stale.with_suffix(".prof").unlink(missing_ok=True)
+
+    return metadata
+
+
+def list_profile_reports() -> list[dict]:
+    """List the stored profile reports, newest first."""
+    if not PROFILING_DIR.exists():
+        return []
+    reports = []
+    for path in sorted(PROFILING_DIR.glob("*.json"), reverse=True):
+        try:
+            reports.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            continue  # evicted or partially written
+    return reports
+
+
+def get_profile_report_path(report_id: str) -> Path | None:
+    """Return the .prof file of a stored report, or None if it does not exist."""
+    if not REPORT_ID_PATTERN.match(report_id):
+        return None
+    path = PROFILING_DIR / f"{report_id}.prof"
+    return path if path.exists() else None
+
+
+def render_profile_report(report_id: str, limit: int = 50) -> str | None:
+    """Render a stored report as pstats text sorted by cumulative time."""
+    path = get_profile_report_path(report_id)
+    if path is None:
+        return None
+    output = io.StringIO()
+    stats = pstats.Stats(str(path), stream=output)
+    stats.sort_stats("cumulative").print_stats(limit)
+    return output.getvalue()
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling a request with cProfile when the `X-Profile: 1`
+    header is sent or the request is sampled. The profiler stays enabled
+    until the response body is fully sent, so streamed responses are covered.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _in_flight, _overlapping
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        _in_flight += 1
+        try:
+            # Profile unless another request is already being profiled
+            if _should_profile(scope) and _profile_lock.acquire(blocking=False):
+                _overlapping = _in_flight - 1
+                await self._profile(scope, receive, send)
+            else:
+                if _profile_lock.locked():
+                    _overlapping += 1
+                await self.app(scope, receive, send)
+        finally:
+            _in_flight -= 1
+
+    async def _profile(self, scope, receive, send):
+        status_code = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        profiler = cProfile.Profile()
+        started_at = datetime.now(timezone.utc)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        profiler.enable()
+        try:
+            with record_llm_calls() as llm_calls:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            cpu_ms = (time.process_time() - cpu_start) * 1000
+            _profile_lock.release()
+
+            metadata = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "started_at": started_at.isoformat(),
+                "wall_ms": round(wall_ms, 3),
+                "cpu_ms": round(cpu_ms, 3),
+                # time spent off-CPU, i.e. awaiting DB / network I/O
+                "await_ms": round(max(wall_ms - cpu_ms, 0.0), 3),
+                # other requests whose CPU time is mixed into this profile
+                "concurrent_requests": _overlapping,
+            }
+            await asyncio.to_thread(_save_profile_report, profiler, metadata, llm_calls)
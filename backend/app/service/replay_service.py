@@ -0,0 +1,345 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.agents.risk_assessment_agent import assess_claim_risk
+from app.agents.routing_agent import decide_routing
+from app.db.database import AsyncSessionLocal
+from app.model.claim_assessment import ClaimAssessment
+from app.model.claims import Claim
+from app.schema.claim_schema import ClaimSchema
+from app.schema.llm_schema import AgentConfigSchema, LLMCallSchema
+from app.schema.replay_schema import ReplaySummarySchema
+from app.schema.risk_schema import RiskAssessmentLLMSchema
+from app.schema.routing_decision_schema import RoutingDecisionLLMSchema
+from app.service.llm_service import record_llm_calls
+
+# --- Shadow mode configuration ---
+SHADOW_SAMPLE_RATE = float(os.getenv("SHADOW_SAMPLE_RATE", "0"))
+SHADOW_MAX_CONCURRENCY = int(os.getenv("SHADOW_MAX_CONCURRENCY", "4"))
+SHADOW_OUTPUT_PATH = Path(os.getenv("SHADOW_OUTPUT_PATH", "./shadow_results.jsonl"))
+
+logger = logging.getLogger(__name__)
+
+_shadow_semaphore = asyncio.Semaphore(SHADOW_MAX_CONCURRENCY)
+_shadow_tasks: set = set()
+
+
+def _read_prompt_file(path: Optional[str]) -> Optional[str]:
+    return Path(path).read_text() if path else None
+
+
+def load_shadow_config() -> AgentConfigSchema:
+    """Candidate configuration of the live shadow mode, read from the environment."""
+    return AgentConfigSchema(
+        model=os.getenv("SHADOW_MODEL") or None,
+        temperature=(
+            float(os.environ["SHADOW_TEMPERATURE"])
+            if os.getenv("SHADOW_TEMPERATURE")
+            else None
+        ),
+        risk_prompt=_read_prompt_file(os.getenv("SHADOW_RISK_PROMPT_FILE")),
+        routing_prompt=_read_prompt_file(os.getenv("SHADOW_ROUTING_PROMPT_FILE")),
+    )
+
+
+def _sum_known(values) -> Optional[int]:
+    """Sum of the reported values, None when none was reported."""
+    known = [value for value in values if value is not None]
+    return sum(known) if known else None
+
+
+def _llm_usage(calls: list[LLMCallSchema]) -> dict:
+    return {
+        "latency_ms": round(sum(call.latency_ms for call in calls), 3),
+        "input_tokens": _sum_known(call.input_tokens for call in calls),
+        "output_tokens": _sum_known(call.output_tokens for call in calls),
+    }
+
+
+def diff_assessment(
+    claim_id: str,
+    baseline: dict,
+    risk: RiskAssessmentLLMSchema,
+    routing: RoutingDecisionLLMSchema,
+    calls: list[LLMCallSchema],
+    baseline_calls: Optional[list[LLMCallSchema]] = None,
+) -> dict:
+    """
+    Compare a candidate risk/routing result with the baseline assessment.
+    With the baseline's LLM calls (shadow mode), latency and token usage are
+    diffed as well; stored assessments (offline replay) have no usage.
+    """
+    candidate = {
+        "risk_category": risk.risk_category.value,
+        "risk_score": risk.risk_score,
+        "processing_score": risk.processing_score,
+        "priority": routing.priority.value,
+        "adjuster_tier": routing.adjuster_tier.value,
+    }
+    return {
+        "claim_id": claim_id,
+        "baseline": baseline,
+        "candidate": candidate,
+        "risk_category_flipped": candidate["risk_category"]
+        != baseline["risk_category"],
+        "risk_score_delta": candidate["risk_score"] - baseline["risk_score"],
+        "processing_score_delta": candidate["processing_score"]
+        - baseline["processing_score"],
+        "priority_changed": candidate["priority"] != baseline["priority"],
+        "adjuster_tier_changed": candidate["adjuster_tier"]
+        != baseline["adjuster_tier"],
+        **_llm_usage(calls),
+        **_usage_delta(calls, baseline_calls),
+    }
+
+
+def _usage_delta(
+    calls: list[LLMCallSchema], baseline_calls: Optional[list[LLMCallSchema]]
+) -> dict:
+    if baseline_calls is None:
+        return {}
+    candidate, baseline = _llm_usage(calls), _llm_usage(baseline_calls)
+    candidate_tokens = _sum_known(
+        [candidate["input_tokens"], candidate["output_tokens"]]
+    )
+    baseline_tokens = _sum_known([baseline["input_tokens"], baseline["output_tokens"]])
+    return {
+        "baseline_latency_ms": baseline["latency_ms"],
+        "baseline_input_tokens": baseline["input_tokens"],
+        "baseline_output_tokens": baseline["output_tokens"],
+        "latency_ms_delta": round(candidate["latency_ms"] - baseline["latency_ms"], 3),
+        "tokens_delta": (
+            candidate_tokens - baseline_tokens
+            if candidate_tokens is not None and baseline_tokens is not None
+            else None
+        ),
+    }
+
+
+async def run_candidate(
+    claim_data: ClaimSchema,
+    baseline: dict,
+    config: AgentConfigSchema,
+    baseline_calls: Optional[list[LLMCallSchema]] = None,
+) -> dict:
+    """Run both agents with the candidate config and diff against the baseline."""
+    # not inherited: a shadow run must not count as LLM time of the request
+    with record_llm_calls(inherit=False) as calls:
+        risk = await assess_claim_risk(claim_data, config)
+        routing = await decide_routing(claim_data, risk, config)
+    return diff_assessment(
+        claim_data.claim_id, baseline, risk, routing, calls, baseline_calls
+    )
+
+
+def _stored_baseline(assessment: ClaimAssessment) -> dict:
+    return {
+        "risk_category": assessment.risk_category.value,
+        "risk_score": assessment.risk_score,
+        "processing_score": assessment.processing_score,
+        "priority": assessment.priority.value,
+        "adjuster_tier": assessment.adjuster_tier,
+    }
+
+
+# --- Offline replay ---
+def _load_checkpoint(checkpoint_path: Path) -> int:
+    if not checkpoint_path.exists():
+        return 0
+    return json.loads(checkpoint_path.read_text())["last_claim_pk"]
+
+
+def _save_checkpoint(checkpoint_path: Path, last_claim_pk: int) -> None:
+    # write-then-rename so a crash never leaves a truncated checkpoint
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"last_claim_pk": last_claim_pk}))
+    tmp_path.replace(checkpoint_path)
+
+
+async def _replay_one(
+    claim: Claim,
+    assessment: ClaimAssessment,
+    config: AgentConfigSchema,
+    semaphore: asyncio.Semaphore,
+) -> dict:
+    async with semaphore:
+        claim_data = ClaimSchema.model_validate(claim, from_attributes=True)
+        try:
+            return await run_candidate(claim_data, _stored_baseline(assessment), config)
+        except Exception as e:
+            return {"claim_id": claim.claim_id, "error": str(e)}
+
+
+async def run_replay(
+    config: AgentConfigSchema,
+    output_path: Path,
+    checkpoint_path: Path,
+    chunk_size: int = 100,
+    concurrency: int = 4,
+    limit: Optional[int] = None,
+) -> ReplaySummarySchema:
+    """
+    Re-run the agents with a candidate config over stored claims and write one
+    diff per claim (JSONL) against the stored claim_assessments.
+    Claims are read in id-ordered chunks; after each chunk the last claim id is
+    checkpointed, so an interrupted replay resumes where it stopped.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    last_claim_pk = _load_checkpoint(checkpoint_path)
+    replayed = 0
+
+    while limit is None or replayed < limit:
+        batch_size = chunk_size if limit is None else min(chunk_size, limit - replayed)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Claim, ClaimAssessment)
+                .join(ClaimAssessment, Claim.id == ClaimAssessment.claim_id)
+                .where(Claim.id > last_claim_pk)
+                .order_by(Claim.id)
+                .limit(batch_size)
+            )
+            rows = result.unique().all()
+        if not rows:
+            break
+
+        results = await asyncio.gather(
+            *(
+                _replay_one(claim, assessment, config, semaphore)
+                for claim, assessment in rows
+            )
+        )
+        with output_path.open("a") as output:
+            for record in results:
+                output.write(json.dumps(record) + "\n")
+
+        last_claim_pk = rows[-1][0].id
+        _save_checkpoint(checkpoint_path, last_claim_pk)
+        replayed += len(rows)
+
+    return summarize_replay(output_path)
+
+
+def summarize_replay(output_path: Path) -> ReplaySummarySchema:
+    """Aggregate the diffs written by a (possibly resumed) replay."""
+    records = []
+    if output_path.exists():
+        with output_path.open() as output:
+            records = [json.loads(line) for line in output]
+    diffs = [record for record in records if "error" not in record]
+    count = len(diffs) or 1
+    return ReplaySummarySchema(
+        replayed=len(records),
+        errors=len(records) - len(diffs),
+        risk_category_flips=sum(d["risk_category_flipped"] for d in diffs),
+        priority_changes=sum(d["priority_changed"] for d in diffs),
+        adjuster_tier_changes=sum(d["adjuster_tier_changed"] for d in diffs),
+        mean_risk_score_delta=sum(d["risk_score_delta"] for d in diffs) / count,
+        mean_abs_risk_score_delta=sum(abs(d["risk_score_delta"]) for d in diffs)
+        / count,
+        mean_latency_ms=sum(d["latency_ms"] for d in diffs) / count,
+        mean_latency_ms_delta=_mean(d.get("latency_ms_delta") for d in diffs),
+        total_input_tokens=sum(d["input_tokens"] or 0 for d in diffs),
+        total_output_tokens=sum(d["output_tokens"] or 0 for d in diffs),
+        mean_tokens_delta=_mean(d.get("tokens_delta") for d in diffs),
+    )
+
+
+def _mean(values) -> Optional[float]:
+    known = [value for value in values if value is not None]
+    return sum(known) / len(known) if known else None
+
+
+# --- Live shadow mode ---
+async def _run_shadow(
+    claim_data: ClaimSchema,
+    risk: RiskAssessmentLLMSchema,
+    routing: RoutingDecisionLLMSchema,
+    calls: list[LLMCallSchema],
+) -> None:
+    try:
+        async with _shadow_semaphore:
+            baseline = {
+                "risk_category": risk.risk_category.value,
+                "risk_score": risk.risk_score,
+                "processing_score": risk.processing_score,
+                "priority": routing.priority.value,
+                "adjuster_tier": routing.adjuster_tier.value,
+            }
+            record = await run_candidate(
+                claim_data, baseline, load_shadow_config(), calls
+            )
+        await asyncio.to_thread(_append_shadow_record, record)
+    except Exception:
+        logger.exception("Shadow evaluation failed for claim %s", claim_data.claim_id)
+
+
+def _append_shadow_record(record: dict) -> None:
+    with SHADOW_OUTPUT_PATH.open("a") as output:
+        output.write(json.dumps(record) + "\n")
+
+
+def maybe_schedule_shadow(
+    claim_data: ClaimSchema,
+    risk: RiskAssessmentLLMSchema,
+    routing: RoutingDecisionLLMSchema,
+    calls: list[LLMCallSchema],
+) -> None:
+    """
+    Run the shadow candidate on a sampled fraction of production claims in the
+    background, diffing against the production result and LLM `calls`.
+    Never awaited by the request and skipped when the shadow concurrency is
+    saturated, so responses are unaffected.
+    """
+    if SHADOW_SAMPLE_RATE <= 0 or random.random() >= SHADOW_SAMPLE_RATE:
+        return
+    if _shadow_semaphore.locked():
+        return
+    task = asyncio.create_task(_run_shadow(claim_data, risk, routing, calls))
+    _shadow_tasks.add(task)  # keep a reference until the task is done
+    task.add_done_callback(_shadow_tasks.discard)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay stored claims against a candidate model / prompt"
+    )
+    parser.add_argument("--model", help="candidate model (default LLM_MODEL)")
+    parser.add_argument("--temperature", type=float)
+    parser.add_argument("--risk-prompt-file", help="candidate risk prompt template")
+    parser.add_argument("--routing-prompt-file", help="candidate routing prompt")
+    parser.add_argument("--output", default="replay_results.jsonl")
+    parser.add_argument("--checkpoint", default="replay_checkpoint.json")
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--limit", type=int, help="stop after this many claims")
+    args = parser.parse_args()
+
+    config = AgentConfigSchema(
+        model=args.model,
+        temperature=args.temperature,
+        risk_prompt=_read_prompt_file(args.risk_prompt_file),
+        routing_prompt=_read_prompt_file(args.routing_prompt_file),
+    )
+    summary = asyncio.run(
+        run_replay(
+            config,
+            Path(args.output),
+            Path(args.checkpoint),
+            chunk_size=args.chunk_size,
+            concurrency=args.concurrency,
+            limit=args.limit,
+        )
+    )
+    print(summary.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+from app.model.claim_timeline import ClaimTimelineEvent
+from app.schema.timeline_schema import ClaimTimelineSchema, TimelineStageSchema
+from app.service.llm_service import record_llm_calls
+
+# --- Timeline writer configuration ---
+# Seconds between flushes of the buffered timeline events
+TIMELINE_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("TIMELINE_FLUSH_INTERVAL_SECONDS", "1")
+)
+# Events kept in memory while waiting for a flush; extra events are dropped
+TIMELINE_BUFFER_SIZE = int(os.getenv("TIMELINE_BUFFER_SIZE", "10000"))
+
+logger = logging.getLogger(__name__)
+
+# Event rows waiting to be written, filled by `submit_timeline`
+_buffer: deque[dict] = deque()
+
+
+class ClaimTimeline:
+    """
+    Stage timings of one claim being processed, with the model, tokens,
+    re-prompts and cache hits of the LLM calls made during each stage.
+    """
+
+    def __init__(self, claim_id: str):
+        self.claim_id = claim_id
+        self.events: list[dict] = []
+
+    @contextmanager
+    def stage(self, stage: str):
+        """
+        Time the enclosed block as `stage`, recording its LLM calls.
+        A stage that raises is recorded with the exception type as `error`.
+        """
+        started_at, start = datetime.now(), time.perf_counter()
+        error = None
+        try:
+            with record_llm_calls() as calls:
+                yield
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            event = {
+                "claim_id": self.claim_id,
+                "stage": stage,
+                "started_at": started_at,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "error": error,
+            }
+            if calls:
+                event.update(
+                    model=calls[-1].model,
+                    input_tokens=_sum_known(call.input_tokens for call in calls),
+                    output_tokens=_sum_known(call.output_tokens for call in calls),
+                    cached_tokens=_sum_known(call.cached_tokens for call in calls),
+                    retries=sum(call.attempt > 1 for call in calls),
+                    hedged=any(call.hedged for call in calls),
+                )
+            self.events.append(event)
+
+
+def _sum_known(values) -> Optional[int]:
+    """Sum of the reported counts; None when the provider reported none."""
+    known = [value for value in values if value is not None]
+    return sum(known) if known else None
+
+
+def submit_timeline(timeline: ClaimTimeline) -> None:
+    """Buffer the events of a processed claim; never blocks the request."""
+    if len(_buffer) + len(timeline.events) > TIMELINE_BUFFER_SIZE:
+        logger.warning("Timeline buffer full, dropped claim %s", timeline.claim_id)
+        return
+    _buffer.extend(timeline.events)
+
+
+async def flush_timeline() -> int:
+    """Write all buffered events in one multi-row INSERT. Returns the count."""
+    rows = [_buffer.popleft() for _ in range(len(_buffer))]
+    if not rows:
+        return 0
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(ClaimTimelineEvent), rows)
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to write %d timeline events", len(rows))
+        return 0
+    return len(rows)
+
+
+async def run_timeline_writer() -> None:
+    """Background loop flushing the timeline buffer, started in the lifespan."""
+    try:
+        while True:
+            await asyncio.sleep(TIMELINE_FLUSH_INTERVAL_SECONDS)
+            await flush_timeline()
+    finally:
+        # write what is left on shutdown
+        await flush_timeline()
+
+
+async def get_claim_timeline(db: AsyncSession, claim_id: str) -> ClaimTimelineSchema:
+    """Processing timeline of a claim, in stage order."""
+    # include events of claims processed since the last background flush
+    await flush_timeline()
+    result = await db.execute(
+        select(ClaimTimelineEvent)
+        .where(ClaimTimelineEvent.claim_id == claim_id)
+        .order_by(ClaimTimelineEvent.id)
+    )
+    events = result.scalars().all()
+    if not events:
+        raise HTTPException(status_code=404, detail="Claim timeline not found")
+
+    stages = [TimelineStageSchema.model_validate(event) for event in events]
+    return ClaimTimelineSchema(
+        claim_id=claim_id,
+        total_ms=round(sum(stage.duration_ms for stage in stages), 3),
+        stages=stages,
+    )
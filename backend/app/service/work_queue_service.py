@@ -0,0 +1,210 @@
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.model.work_queue import Adjuster, WorkItem
+from app.schema.routing_decision_schema import AdjusterTier, Priority
+from app.schema.work_queue_schema import (
+    AdjusterLoadSchema,
+    AdjusterSchema,
+    TierQueueMetrics,
+    WorkItemSchema,
+    WorkItemStatus,
+    WorkQueueMetricsSchema,
+)
+
+# Lower rank is served first; ties are served oldest first
+PRIORITY_RANK = {Priority.URGENT: 0, Priority.MEDIUM: 1}
+# Number of recent queue waits used per tier for the wait-time metrics
+WAIT_SAMPLES = 1000
+
+# The per-tier queues are the `ix_work_items_queue` index on
+# (tier, status, priority_rank, enqueued_at): taking the head of a queue is an
+# O(log n) index seek, and every worker process sees the same queues.
+
+
+def _to_schema(item: WorkItem) -> WorkItemSchema:
+    return WorkItemSchema.model_validate(item, from_attributes=True)
+
+
+def add_work_item(
+    db: AsyncSession, claim_id: str, tier: AdjusterTier, priority: Priority
+) -> WorkItem:
+    """
+    Queue a routed claim in the caller's transaction; adjusters can take it
+    as soon as the transaction is committed.
+    """
+    item = WorkItem(
+        claim_id=claim_id,
+        tier=tier,
+        priority=priority,
+        priority_rank=PRIORITY_RANK[priority],
+        status=WorkItemStatus.QUEUED,
+        enqueued_at=datetime.now(),
+    )
+    db.add(item)
+    return item
+
+
+async def backfill_priority_ranks(db: AsyncSession) -> None:
+    """Rank work items queued before `priority_rank` existed (run at startup)."""
+    await db.execute(
+        update(WorkItem)
+        .where(WorkItem.priority_rank.is_(None))
+        .values(
+            priority_rank=case(
+                *(
+                    (WorkItem.priority == priority, rank)
+                    for priority, rank in PRIORITY_RANK.items()
+                )
+            )
+        )
+    )
+    await db.commit()
+
+
+async def register_adjuster(
+    db: AsyncSession, adjuster_data: AdjusterSchema
+) -> AdjusterSchema:
+    """Create or update an adjuster, keeping the claims it is working on."""
+    await db.merge(
+        Adjuster(
+            id=adjuster_data.adjuster_id,
+            tier=adjuster_data.tier,
+            capacity=adjuster_data.capacity,
+        )
+    )
+    await db.commit()
+    return adjuster_data
+
+
+async def claim_next_work_item(db: AsyncSession, adjuster_id: str) -> WorkItemSchema:
+    """
+    Assign the most urgent, oldest claim of the adjuster's tier to the adjuster.
+    Fails with 409 when the adjuster is at capacity and 404 when the queue is empty.
+    """
+    adjuster = await db.get(Adjuster, adjuster_id)
+    if adjuster is None:
+        raise HTTPException(status_code=404, detail="Adjuster not found")
+
+    queued, active = aliased(WorkItem), aliased(WorkItem)
+    head_of_queue = (
+        select(queued.id)
+        .where(queued.tier == adjuster.tier, queued.status == WorkItemStatus.QUEUED)
+        .order_by(queued.priority_rank, queued.enqueued_at, queued.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    active_count = (
+        select(func.count(active.id))
+        .where(
+            active.adjuster_id == adjuster_id,
+            active.status == WorkItemStatus.ASSIGNED,
+        )
+        .scalar_subquery()
+    )
+    # One statement, so concurrent claims (from any worker process) can
+    # neither take the same item nor exceed the adjuster's capacity
+    item = await db.scalar(
+        update(WorkItem)
+        .where(
+            WorkItem.id == head_of_queue,
+            WorkItem.status == WorkItemStatus.QUEUED,
+            active_count < adjuster.capacity,
+        )
+        .values(
+            status=WorkItemStatus.ASSIGNED,
+            adjuster_id=adjuster_id,
+            assigned_at=datetime.now(),
+        )
+        .returning(WorkItem)
+    )
+    await db.commit()
+    if item is not None:
+        return _to_schema(item)
+
+    if await db.scalar(select(active_count)) >= adjuster.capacity:
+        raise HTTPException(status_code=409, detail="Adjuster is at capacity")
+    raise HTTPException(status_code=404, detail="No claims queued for this tier")
+
+
+async def complete_work_item(db: AsyncSession, claim_id: str) -> WorkItemSchema:
+    """Mark an assigned claim as completed and free the adjuster's slot."""
+    item = await db.scalar(
+        update(WorkItem)
+        .where(
+            WorkItem.claim_id == claim_id,
+            WorkItem.status == WorkItemStatus.ASSIGNED,
+        )
+        .values(status=WorkItemStatus.COMPLETED, completed_at=datetime.now())
+        .returning(WorkItem)
+    )
+    await db.commit()
+    if item is None:
+        raise HTTPException(status_code=404, detail="Assigned work item not found")
+    return _to_schema(item)
+
+
+async def get_work_queue_metrics(db: AsyncSession) -> WorkQueueMetricsSchema:
+    """Queue depth, wait times and adjuster load per tier."""
+    now = datetime.now()
+    result = await db.execute(
+        select(
+            WorkItem.tier,
+            WorkItem.status,
+            func.count(WorkItem.id),
+            func.min(WorkItem.enqueued_at),
+        )
+        .where(WorkItem.status != WorkItemStatus.COMPLETED)
+        .group_by(WorkItem.tier, WorkItem.status)
+    )
+    open_items = {
+        (tier, status): (count, oldest) for tier, status, count, oldest in result
+    }
+
+    tiers = {}
+    for tier in AdjusterTier:
+        result = await db.execute(
+            select(WorkItem.enqueued_at, WorkItem.assigned_at)
+            .where(WorkItem.tier == tier, WorkItem.assigned_at.is_not(None))
+            .order_by(WorkItem.assigned_at.desc())
+            .limit(WAIT_SAMPLES)
+        )
+        waits = sorted(
+            (assigned_at - enqueued_at).total_seconds()
+            for enqueued_at, assigned_at in result
+        )
+        depth, oldest = open_items.get((tier, WorkItemStatus.QUEUED), (0, None))
+        in_progress, _ = open_items.get((tier, WorkItemStatus.ASSIGNED), (0, None))
+        tiers[tier.value] = TierQueueMetrics(
+            depth=depth,
+            in_progress=in_progress,
+            oldest_wait_seconds=(now - oldest).total_seconds() if oldest else 0.0,
+            avg_wait_seconds=sum(waits) / len(waits) if waits else 0.0,
+            p90_wait_seconds=waits[int(len(waits) * 0.9)] if waits else 0.0,
+        )
+
+    result = await db.execute(
+        select(Adjuster, func.count(WorkItem.id))
+        .outerjoin(
+            WorkItem,
+            (WorkItem.adjuster_id == Adjuster.id)
+            & (WorkItem.status == WorkItemStatus.ASSIGNED),
+        )
+        .group_by(Adjuster.id)
+    )
+    return WorkQueueMetricsSchema(
+        tiers=tiers,
+        adjusters=[
+            AdjusterLoadSchema(
+                adjuster_id=adjuster.id,
+                tier=adjuster.tier,
+                capacity=adjuster.capacity,
+                active=active,
+            )
+            for adjuster, active in result
+        ],
+    )
@@ -0,0 +1,68 @@
+"""
+Import-time benchmark for the backend entry points.
+
+Each module is imported in a fresh interpreter so results reflect cold start.
+Run from the backend directory:
+
+    python benchmarks/bench_import_time.py [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "app.main",
+    "app.route.claim_route",
+    "app.service.claim_service",
+    "app.service.llm_service",
+]
+
+# Heavy modules that must only be loaded when an LLM is actually used
+DEFERRED_MODULES = ["langchain_google_genai", "langchain_core.prompts"]
+
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {deferred!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure(module: str, runs: int) -> tuple[list[float], str]:
+    timings, loaded = [], ""
+    for _ in range(runs):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                SNIPPET.format(module=module, deferred=DEFERRED_MODULES),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, _, loaded = result.stdout.strip().partition(" ")
+        timings.append(float(elapsed) * 1000)
+    return timings, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'module':<30} {'median ms':>10} {'min ms':>10}  deferred modules loaded")
+    for module in MODULES:
+        timings, loaded = measure(module, args.runs)
+        print(
+            f"{module:<30} {statistics.median(timings):>10.1f} "
+            f"{min(timings):>10.1f}  {loaded or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
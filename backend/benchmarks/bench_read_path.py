@@ -0,0 +1,208 @@
+"""
+Read path cost per page / lookup: ORM entities (ClaimAssessment with its
+joined Claim, as before) versus the column projections used by
+list_claim_assessments_paginated and get_claim_assessment_by_claim_id.
+Reports mean latency, memory left for the cycle collector and memory retained
+per call on a throwaway SQLite database. Run from the backend directory:
+
+    python benchmarks/bench_read_path.py [--claims 5000] [--page-size 50]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+from pathlib import Path
+
+# a throwaway database, set before the engine is created
+_tmp_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp_dir}/bench.db"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.db.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.model.claim_assessment import ClaimAssessment  # noqa: E402
+from app.model.claims import Claim  # noqa: E402
+from app.schema.claim_assessment_schema import (  # noqa: E402
+    ClaimAssessmentDetailedSchema,
+    ClaimAssessmentListSchema,
+    ClaimAssessmentSimpleSchema,
+)
+from app.schema.claim_schema import ClaimSchema  # noqa: E402
+from app.schema.risk_schema import (  # noqa: E402
+    RiskAssessmentLLMSchema,
+    RiskCategory,
+)
+from app.schema.routing_decision_schema import (  # noqa: E402
+    Priority,
+    RoutingDecisionLLMSchema,
+)
+from app.service.claim_service import (  # noqa: E402
+    get_claim_assessment_by_claim_id,
+    list_claim_assessments_paginated,
+)
+
+
+async def seed(count: int) -> None:
+    engine.echo = False
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(Claim),
+            [
+                {
+                    "id": i,
+                    "claim_id": f"CLM-{i:06d}",
+                    "type": "auto_collision",
+                    "date": date(2024, 1, 15),
+                    "amount": 2500.0,
+                    "description": "Rear-ended at a traffic light, bumper damage. "
+                    * 20,
+                    "customer_id": f"CUST-{i}",
+                    "policy_number": "POL-789-ACTIVE",
+                    "incident_location": "123 Main St, Springfield",
+                    "timestamp_submitted": datetime(2024, 1, 15, 14, 30),
+                }
+                for i in range(1, count + 1)
+            ],
+        )
+        await conn.execute(
+            insert(ClaimAssessment),
+            [
+                {
+                    "claim_id": i,
+                    "risk_score": 5,
+                    "risk_category": RiskCategory.MEDIUM,
+                    "fraud_indicators": "late policy activation, high claim amount",
+                    "processing_score": 7,
+                    "priority": Priority.MEDIUM,
+                    "adjuster_tier": "standard",
+                }
+                for i in range(1, count + 1)
+            ],
+        )
+
+
+# --- Previous entity-based implementations, for comparison ---
+async def list_with_entities(db, page_no: int, page_size: int):
+    result = await db.execute(
+        select(ClaimAssessment).offset((page_no - 1) * page_size).limit(page_size)
+    )
+    return ClaimAssessmentListSchema(
+        page_no=page_no,
+        page_size=page_size,
+        data=[
+            ClaimAssessmentSimpleSchema(
+                claim_id=a.claim.claim_id,
+                risk_level=a.risk_category.value,
+                priority=a.priority.value,
+                adjuster_tier=[a.adjuster_tier],
+            )
+            for a in result.scalars().all()
+        ],
+    )
+
+
+async def detail_with_entities(db, claim_id: str):
+    result = await db.execute(
+        select(ClaimAssessment)
+        .join(Claim, ClaimAssessment.claim_id == Claim.id)
+        .where(Claim.claim_id == claim_id)
+    )
+    a = result.scalars().first()
+    return ClaimAssessmentDetailedSchema(
+        claim=ClaimSchema.model_validate(a.claim, from_attributes=True),
+        risk_assessment=RiskAssessmentLLMSchema(
+            fraud_indicators=a.fraud_indicators.split(", "),
+            risk_score=a.risk_score,
+            risk_category=a.risk_category,
+            processing_score=a.processing_score,
+        ),
+        routing_decision=RoutingDecisionLLMSchema(
+            priority=a.priority, adjuster_tier=a.adjuster_tier
+        ),
+    )
+
+
+async def measure(name: str, call, calls: int) -> None:
+    # a fresh session per call, as per request in the API
+    async def run(i: int):
+        async with AsyncSessionLocal() as db:
+            await call(db, i)
+
+    await run(0)  # warm up statement caches
+
+    start = time.perf_counter()
+    for i in range(calls):
+        await run(i)
+    latency_ms = (time.perf_counter() - start) * 1000 / calls
+
+    # GC is paused so that the cyclic garbage of every call (ORM row
+    # processors, result objects) is counted, instead of depending on when
+    # a collection happens to run
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    for i in range(calls):
+        await run(i)
+    _, peak = tracemalloc.get_traced_memory()
+    gc.enable()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:<22} {latency_ms:8.3f} ms/call   "
+        f"{peak / calls / 1024:8.1f} KiB left to GC/call   "
+        f"{retained / calls / 1024:8.1f} KiB retained/call"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--claims", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=100)
+    args = parser.parse_args()
+
+    await seed(args.claims)
+    pages = max(args.claims // args.page_size, 1)
+
+    def page(i: int) -> int:
+        return i % pages + 1
+
+    def claim_id(i: int) -> str:
+        return f"CLM-{i % args.claims + 1:06d}"
+
+    print(f"{args.claims} claims, pages of {args.page_size}")
+    await measure(
+        "listing (entities)",
+        lambda db, i: list_with_entities(db, page(i), args.page_size),
+        args.calls,
+    )
+    await measure(
+        "listing (projection)",
+        lambda db, i: list_claim_assessments_paginated(db, page(i), args.page_size),
+        args.calls,
+    )
+    await measure(
+        "detail (entities)",
+        lambda db, i: detail_with_entities(db, claim_id(i)),
+        args.calls,
+    )
+    await measure(
+        "detail (projection)",
+        lambda db, i: get_claim_assessment_by_claim_id(db, claim_id(i)),
+        args.calls,
+    )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
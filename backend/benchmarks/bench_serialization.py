@@ -0,0 +1,112 @@
+"""
+Serialization cost per response: FastAPI's generic path (jsonable_encoder +
+JSONResponse) versus FastJSONResponse, for listing, detail and dashboard payloads.
+Run from the backend directory:
+
+    python benchmarks/bench_serialization.py [--number 2000]
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.route.json_response import FastJSONResponse  # noqa: E402
+from app.schema.claim_assessment_schema import (  # noqa: E402
+    ClaimAssessmentDetailedSchema,
+    ClaimAssessmentListSchema,
+    ClaimAssessmentSimpleSchema,
+)
+from app.schema.claim_schema import ClaimSchema  # noqa: E402
+from app.schema.dashboard_schema import (  # noqa: E402
+    DashboardDataSchema,
+    RecentActivity,
+)
+from app.schema.risk_schema import RiskAssessmentLLMSchema  # noqa: E402
+from app.schema.routing_decision_schema import RoutingDecisionLLMSchema  # noqa: E402
+
+
+def build_payloads() -> dict:
+    claim = ClaimSchema(
+        claim_id="CLM-2024-001",
+        type="auto_collision",
+        date=date(2024, 1, 15),
+        amount=2500,
+        description="Minor fender bender in parking lot at low speed. " * 5,
+        customer_id="CUST-123",
+        policy_number="POL-789-ACTIVE",
+        incident_location="123 Main St, Springfield",
+        timestamp_submitted=datetime(2024, 1, 15, 14, 30),
+        injuries_reported=False,
+        other_party_involved=True,
+        customer_tenure_days=1095,
+        previous_claims_count=0,
+    )
+    risk = RiskAssessmentLLMSchema(
+        fraud_indicators=["late policy activation", "high claim amount"],
+        risk_score=7,
+        risk_category="high",
+        processing_score=8,
+    )
+    routing = RoutingDecisionLLMSchema(priority="urgent", adjuster_tier="senior")
+
+    listing = ClaimAssessmentListSchema(
+        page_no=1,
+        page_size=10,
+        data=[
+            ClaimAssessmentSimpleSchema(
+                claim_id=f"CLM-2024-{i:03}",
+                risk_level="high",
+                priority="urgent",
+                adjuster_tier=["senior"],
+            )
+            for i in range(10)
+        ],
+    )
+    detail = ClaimAssessmentDetailedSchema(
+        claim=claim, risk_assessment=risk, routing_decision=routing
+    )
+    dashboard = DashboardDataSchema(
+        total_claims=1000,
+        recent_activity=[
+            RecentActivity(
+                claim_id=f"CLM-2024-{i:03}",
+                type="auto_collision",
+                amount=2500.0,
+                risk_level="high",
+                priority="urgent",
+                submitted_date=date(2024, 1, 15),
+            )
+            for i in range(10)
+        ],
+        top_claim_types={"auto_collision": 600, "property_damage": 400},
+        high_risk_locations=["123 Main St, Springfield"] * 5,
+    )
+    return {"listing": listing, "detail": detail, "dashboard": dashboard}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'payload':<12} {'generic us':>12} {'fast us':>10} {'speedup':>8}")
+    for name, payload in build_payloads().items():
+        generic = timeit.timeit(
+            lambda: JSONResponse(jsonable_encoder(payload)), number=args.number
+        )
+        fast = timeit.timeit(lambda: FastJSONResponse(payload), number=args.number)
+        print(
+            f"{name:<12} {generic / args.number * 1e6:>12.1f} "
+            f"{fast / args.number * 1e6:>10.1f} {generic / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
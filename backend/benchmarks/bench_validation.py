@@ -0,0 +1,50 @@
+"""
+Batch claim validation throughput: claims/second through `validate_claims`
+(rule sets compiled once per claim type), over the sample claims repeated.
+Run from the backend directory:
+
+    python benchmarks/bench_validation.py [--claims 10000]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.agents.intake_agent import validate_claims  # noqa: E402
+from app.schema.claim_schema import ClaimSchema  # noqa: E402
+
+SAMPLE_DATA = Path(__file__).resolve().parents[1] / "sample_data.json"
+
+
+def load_claims(count: int) -> list[ClaimSchema]:
+    samples = [
+        ClaimSchema.model_validate(claim)
+        for claim in json.loads(SAMPLE_DATA.read_text())["claims"]
+        if claim["date"]
+    ]
+    return [samples[i % len(samples)] for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--claims", type=int, default=10000)
+    args = parser.parse_args()
+
+    claims = load_claims(args.claims)
+    start = time.perf_counter()
+    results = validate_claims(claims)
+    elapsed = time.perf_counter() - start
+
+    invalid = sum(not result.valid for result in results)
+    print(
+        f"{len(claims)} claims in {elapsed * 1000:.1f} ms "
+        f"({len(claims) / elapsed:,.0f} claims/s, {invalid} invalid)"
+    )
+
+
+if __name__ == "__main__":
+    main()